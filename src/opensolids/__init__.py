@@ -1,4 +1,4 @@
-from .api import list_material_ids, list_providers, material, register_provider, search
+from .api import list_material_ids, list_providers, material, register_provider, search, warm_up
 from .material import Material
 from .types import MaterialSummary, SourceRef
 
@@ -11,4 +11,5 @@ __all__ = [
     "list_material_ids",
     "list_providers",
     "register_provider",
+    "warm_up",
 ]
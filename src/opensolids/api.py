@@ -4,7 +4,7 @@ from collections.abc import Iterable
 
 from .material import Material
 from .providers.base import Provider
-from .registry import ProviderRegistry, default_registry
+from .registry import ProviderRegistry, WarmUpTiming, default_registry
 from .types import MaterialSummary
 
 
@@ -18,24 +18,18 @@ def search(
     *,
     required_properties: Iterable[str] | None = None,
     include_provider_records: bool = False,
+    fuzzy: bool = False,
+    limit: int | None = None,
     registry: ProviderRegistry | None = None,
 ) -> list[MaterialSummary]:
     reg = registry or default_registry()
-    hits = reg.search(query, include_provider_records=include_provider_records)
-
-    if required_properties is None:
-        return hits
-
-    required = {p for p in required_properties}
-    if not required:
-        return hits
-
-    filtered: list[MaterialSummary] = []
-    for hit in hits:
-        mat = reg.material(hit.id)
-        if required.issubset(set(mat.available_properties())):
-            filtered.append(hit)
-    return filtered
+    return reg.search(
+        query,
+        include_provider_records=include_provider_records,
+        required_properties=required_properties,
+        fuzzy=fuzzy,
+        limit=limit,
+    )
 
 
 def list_providers(*, registry: ProviderRegistry | None = None) -> list[str]:
@@ -59,3 +53,13 @@ def list_material_ids(
 def register_provider(provider: Provider, *, registry: ProviderRegistry | None = None) -> None:
     reg = registry or default_registry()
     reg.register(provider)
+
+
+def warm_up(
+    *,
+    max_workers: int | None = None,
+    build_curves: bool = False,
+    registry: ProviderRegistry | None = None,
+) -> list[WarmUpTiming]:
+    reg = registry or default_registry()
+    return reg.warm_up(max_workers=max_workers, build_curves=build_curves)
@@ -4,8 +4,11 @@ import argparse
 import json
 from pathlib import Path
 
+from opensolids.providers.base import write_pack_index
+from opensolids.providers.compiled_pack import compile_pack
 from opensolids.providers.mil_hdbk_5.import_local import import_mil_hdbk_5_pdf
 from opensolids.providers.nist_cryo.sync import sync_nist_cryo
+from opensolids.providers.sqlite.importer import import_json_packs
 from opensolids.providers.ntrs_openapi.sync import sync_ntrs
 
 
@@ -20,6 +23,13 @@ def _default_pack_dir(name: str) -> Path:
 
 
 
+def _bundled_pack_dirs() -> list[Path]:
+    from opensolids.registry import default_registry
+
+    return [provider._resolve_base_path() for provider in default_registry().providers.values()]
+
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="opensolids")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -58,6 +68,51 @@ def build_parser() -> argparse.ArgumentParser:
     mil.add_argument("--product-form", default=None)
     mil.add_argument("--direction", default=None)
 
+    sqlite = import_sub.add_parser("sqlite", help="Import JSON data packs into a SQLite catalog")
+    sqlite.add_argument("--db", required=True, type=Path)
+    sqlite.add_argument(
+        "--pack",
+        dest="packs",
+        type=Path,
+        action="append",
+        default=[],
+        help="Data-pack directory to import (repeatable; default: all bundled packs)",
+    )
+
+    compile_parser = subparsers.add_parser(
+        "compile", help="Compile JSON data packs into memory-mappable pack files"
+    )
+    compile_parser.add_argument(
+        "--pack",
+        dest="packs",
+        type=Path,
+        action="append",
+        default=[],
+        help="Data-pack directory to compile (repeatable; default: all bundled packs)",
+    )
+
+    index_parser = subparsers.add_parser(
+        "index", help="Rebuild the material index stored in data-pack manifests"
+    )
+    index_parser.add_argument(
+        "--pack",
+        dest="packs",
+        type=Path,
+        action="append",
+        default=[],
+        help="Data-pack directory to index (repeatable; default: all bundled packs)",
+    )
+
+    preload_parser = subparsers.add_parser(
+        "preload", help="Materialize the default registry and report fork-sharing memory use"
+    )
+    preload_parser.add_argument(
+        "--measure",
+        action="store_true",
+        help="Fork workers and compare RSS/USS of preloaded and cold workers (Linux only)",
+    )
+    preload_parser.add_argument("--workers", type=int, default=4)
+
     return parser
 
 
@@ -97,6 +152,39 @@ def main(argv: list[str] | None = None) -> int:
         print(json.dumps(manifest, indent=2))
         return 0
 
+    if args.command == "import" and args.provider == "sqlite":
+        manifest = import_json_packs(args.db, args.packs or _bundled_pack_dirs())
+        print(json.dumps(manifest, indent=2))
+        return 0
+
+    if args.command == "compile":
+        results = [compile_pack(pack) for pack in (args.packs or _bundled_pack_dirs())]
+        print(json.dumps(results, indent=2))
+        return 0
+
+    if args.command == "index":
+        for pack in args.packs or _bundled_pack_dirs():
+            manifest = write_pack_index(pack)
+            print(f"{pack}: {len(manifest['materials'])} materials indexed")
+        return 0
+
+    if args.command == "preload":
+        from dataclasses import asdict
+
+        from opensolids.preload import measure_fork_sharing, preload
+
+        if not args.measure:
+            print(json.dumps(asdict(preload(freeze=False)), indent=2))
+            return 0
+        report = measure_fork_sharing(args.workers)
+        summary = {
+            **asdict(report),
+            "rss_saved_kb_per_worker": report.rss_saved_kb,
+            "uss_saved_kb_per_worker": report.uss_saved_kb,
+        }
+        print(json.dumps(summary, indent=2))
+        return 0
+
     parser.error("Unhandled command")
     return 2
 
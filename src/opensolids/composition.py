@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from .canonical_catalog import CanonicalMaterialSpec
+from .providers.base import Provider
+from .types import SourceRef
+
+
+def _read_only(value: Any) -> Any:
+    if isinstance(value, dict):
+        return ReadOnlyRecord(value)
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+class ReadOnlyRecord(Mapping[str, Any]):
+    """Read-only view over a provider record; nested dicts and lists are wrapped on access."""
+
+    __slots__ = ("_base",)
+
+    def __init__(self, base: Mapping[str, Any]):
+        self._base = base
+
+    def __getitem__(self, key: str) -> Any:
+        return _read_only(self._base[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._base)
+
+    def __len__(self) -> int:
+        return len(self._base)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._base!r})"
+
+
+class CurveRecordView(ReadOnlyRecord):
+    """Provider curve record shared without copying, with canonical metadata held separately.
+
+    The merged ``metadata`` dict is only built when first read, typically by
+    ``Material.curve()`` materializing the property.
+    """
+
+    __slots__ = ("overlay", "_metadata")
+
+    def __init__(self, base: Mapping[str, Any], overlay: Mapping[str, Any]):
+        super().__init__(base)
+        self.overlay = overlay
+        self._metadata: dict[str, Any] | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key != "metadata":
+            return super().__getitem__(key)
+        if self._metadata is None:
+            self._metadata = {**self._base.get("metadata", {}), **self.overlay}
+        return self._metadata
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        if "metadata" not in self._base:
+            yield "metadata"
+
+    def __len__(self) -> int:
+        return len(self._base) + ("metadata" not in self._base)
+
+
+@dataclass(frozen=True)
+class PropertySelection:
+    property_key: str
+    provider: str
+    material_id: str
+    rank: int
+    candidates: tuple[str, ...]
+    curve_record: dict[str, Any] = field(repr=False, compare=False)
+
+    def view(self) -> CurveRecordView:
+        return CurveRecordView(
+            self.curve_record,
+            {
+                "source_provider": self.provider,
+                "source_material_id": self.material_id,
+                "selection_rank": self.rank,
+            },
+        )
+
+
+@dataclass(frozen=True)
+class CompositionPlan:
+    canonical_id: str
+    selections: Mapping[str, PropertySelection]
+    unresolved: tuple[str, ...]
+    source_lookup: Mapping[str, SourceRef] = field(repr=False, compare=False)
+
+    def describe(self) -> dict[str, dict[str, Any]]:
+        return {
+            key: {
+                "provider": sel.provider,
+                "material_id": sel.material_id,
+                "rank": sel.rank,
+                "source_id": sel.curve_record.get("source_id"),
+            }
+            for key, sel in self.selections.items()
+        }
+
+
+def compile_composition_plan(
+    spec: CanonicalMaterialSpec,
+    resolve: Callable[[str], tuple[Provider, dict]],
+) -> CompositionPlan:
+    selections: dict[str, PropertySelection] = {}
+    unresolved: list[str] = []
+    used_providers: dict[str, Provider] = {}
+    resolved: dict[str, tuple[Provider, dict] | None] = {}
+
+    for property_key, candidates in spec.property_sources.items():
+        for rank, source_material_id in enumerate(candidates, start=1):
+            if source_material_id not in resolved:
+                try:
+                    resolved[source_material_id] = resolve(source_material_id)
+                except KeyError:
+                    resolved[source_material_id] = None
+            hit = resolved[source_material_id]
+            if hit is None:
+                continue
+
+            provider, source_record = hit
+            source_curve = source_record.get("properties", {}).get(property_key)
+            if source_curve is None:
+                continue
+
+            selections[property_key] = PropertySelection(
+                property_key=property_key,
+                provider=provider.name,
+                material_id=source_record["id"],
+                rank=rank,
+                candidates=tuple(candidates),
+                curve_record=source_curve,
+            )
+            used_providers.setdefault(provider.name, provider)
+            break
+        else:
+            unresolved.append(property_key)
+
+    source_lookup: dict[str, SourceRef] = {}
+    for provider in used_providers.values():
+        source_lookup.update(provider.source_lookup())
+
+    return CompositionPlan(
+        canonical_id=spec.id,
+        selections=MappingProxyType(selections),
+        unresolved=tuple(unresolved),
+        source_lookup=MappingProxyType(source_lookup),
+    )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
@@ -13,9 +14,9 @@ from .models import (
     PolynomialModel,
     TabularModel,
 )
-from .policies import apply_temperature_policy, validate_policy
+from .policies import apply_temperature_policy, out_of_range_error, validate_policy
 from .types import SourceRef
-from .units import as_array_with_scalar_flag, restore_scalar_if_needed
+from .units import affine_conversion, as_array_with_scalar_flag, restore_scalar_if_needed
 
 
 @dataclass
@@ -31,14 +32,141 @@ class PropertyCurve:
     source_ref: SourceRef | None
     reference_temperature: float | None = None
     metadata: dict[str, Any] | None = None
+    _antiderivative: CurveAntiderivative | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __call__(self, T, *, policy: str | None = None):
+        if isinstance(T, (float, int)):
+            return self.evaluate_scalar(float(T), policy=policy)
         arr, was_scalar = as_array_with_scalar_flag(T)
         policy_value = validate_policy(policy)
         adjusted = apply_temperature_policy(arr, self.valid_T_min, self.valid_T_max, policy_value)
         values = np.asarray(self.model.evaluate(adjusted), dtype=float)
         return restore_scalar_if_needed(values, was_scalar)
 
+    def evaluate_scalar(self, T: float, *, policy: str | None = None) -> float:
+        """Single-point evaluation in plain floats, without allocating arrays."""
+        if policy is None or policy == "clamp":
+            # Written out so NaN passes through, as with np.clip.
+            if T < self.valid_T_min:
+                T = self.valid_T_min
+            elif T > self.valid_T_max:
+                T = self.valid_T_max
+        elif policy == "raise":
+            if T < self.valid_T_min or T > self.valid_T_max:
+                raise out_of_range_error(self.valid_T_min, self.valid_T_max, T, T)
+        else:
+            validate_policy(policy)
+
+        evaluate_scalar = getattr(self.model, "evaluate_scalar", None)
+        if evaluate_scalar is None:
+            return float(self.model.evaluate(np.array([T]))[0])
+        return float(evaluate_scalar(T))
+
+    def antiderivative(self) -> CurveAntiderivative:
+        """Cumulative integral of this curve, tabulated on first use."""
+        if self._antiderivative is None:
+            self._antiderivative = CurveAntiderivative(self)
+        return self._antiderivative
+
+
+
+class BoundProperty:
+    """A curve with its policy, output units and scalar kernel resolved once.
+
+    Returned by ``Material.bind``; calling it costs the clamp, the model kernel and one
+    multiply-add for the unit conversion.
+    """
+
+    __slots__ = ("curve", "units", "policy", "scale", "offset", "_lo", "_hi", "_kernel")
+
+    def __init__(
+        self, curve: PropertyCurve, *, units: str | None = None, policy: str | None = None
+    ):
+        self.curve = curve
+        self.policy = validate_policy(policy)
+        self.units = units or curve.units
+        self.scale, self.offset = affine_conversion(curve.units, self.units)
+        self._lo = curve.valid_T_min
+        self._hi = curve.valid_T_max
+        kernel = getattr(curve.model, "evaluate_scalar", None)
+        self._kernel = kernel or (lambda T: float(curve.model.evaluate(np.array([T]))[0]))
+
+    def __call__(self, T):
+        if not isinstance(T, (float, int)):
+            values = self.curve(T, policy=self.policy)
+            if self.scale == 1.0 and self.offset == 0.0:
+                return values
+            return values * self.scale + self.offset
+
+        if self.policy == "clamp":
+            if T < self._lo:
+                T = self._lo
+            elif T > self._hi:
+                T = self._hi
+        elif self.policy == "raise" and (T < self._lo or T > self._hi):
+            raise out_of_range_error(self._lo, self._hi, float(T), float(T))
+        value = self._kernel(float(T))
+        if self.scale == 1.0 and self.offset == 0.0:
+            return value
+        return value * self.scale + self.offset
+
+    def __repr__(self) -> str:
+        return (
+            f"BoundProperty({self.curve.property_key!r}, units={self.units!r}, "
+            f"policy={self.policy!r})"
+        )
+
+
+class CurveAntiderivative:
+    """``F(T) = integral of curve(t) dt from valid_T_min to T``, tabulated once.
+
+    The curve is integrated with the trapezoid rule on a fine uniform grid over its valid
+    range, so inside the range ``F`` is a single ``np.interp``. Beyond the range the
+    policy decides: clamped curves continue linearly with their edge value, extrapolated
+    models are integrated from the nearest edge with Gauss-Legendre quadrature and
+    ``"raise"`` rejects the temperatures.
+    """
+
+    GRID_POINTS = 4097
+
+    _GAUSS_NODES, _GAUSS_WEIGHTS = np.polynomial.legendre.leggauss(16)
+
+    def __init__(self, curve: PropertyCurve):
+        self.curve = curve
+        lo, hi = curve.valid_T_min, curve.valid_T_max
+        grid = np.linspace(lo, hi, self.GRID_POINTS) if hi > lo else np.array([lo])
+        values = np.array(curve.model.evaluate(grid), dtype=float)
+        cumulative = np.zeros_like(grid)
+        np.cumsum(0.5 * (values[1:] + values[:-1]) * np.diff(grid), out=cumulative[1:])
+        self._grid = grid
+        self._cumulative = cumulative
+        self._edge_values = (float(values[0]), float(values[-1]))
+
+    def __call__(self, T, *, policy: str | None = None):
+        arr, was_scalar = as_array_with_scalar_flag(T)
+        policy_value = validate_policy(policy)
+        lo, hi = self.curve.valid_T_min, self.curve.valid_T_max
+        if policy_value == "raise":
+            apply_temperature_policy(arr, lo, hi, policy_value)
+
+        out = np.interp(arr, self._grid, self._cumulative)
+        below = arr < lo
+        if below.any():
+            out[below] += self._tail(arr[below], lo, self._edge_values[0], policy_value)
+        above = arr > hi
+        if above.any():
+            out[above] += self._tail(arr[above], hi, self._edge_values[1], policy_value)
+        return restore_scalar_if_needed(out, was_scalar)
+
+    def _tail(self, T: np.ndarray, edge: float, edge_value: float, policy: str) -> np.ndarray:
+        if policy != "extrapolate":
+            return edge_value * (T - edge)
+        half = 0.5 * (T - edge)
+        nodes = edge + half[:, None] * (1.0 + self._GAUSS_NODES)
+        values = np.asarray(self.curve.model.evaluate(nodes.ravel()), dtype=float)
+        return half * (values.reshape(nodes.shape) @ self._GAUSS_WEIGHTS)
 
 
 def build_model(model_spec: dict[str, Any]):
@@ -71,7 +199,7 @@ def build_model(model_spec: dict[str, Any]):
 def curve_from_record(
     property_key: str,
     curve_record: dict[str, Any],
-    source_refs: dict[str, SourceRef],
+    source_refs: Mapping[str, SourceRef],
 ) -> PropertyCurve:
     model_spec = curve_record["model"]
     source_id = curve_record.get("source_id")
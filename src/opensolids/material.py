@@ -1,12 +1,64 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
 
 import numpy as np
 
-from .curve import PropertyCurve, curve_from_record
+from .curve import BoundProperty, PropertyCurve, curve_from_record
 from .types import SourceRef
-from .units import as_array_with_scalar_flag, convert_values, restore_scalar_if_needed
+from .units import (
+    affine_conversion,
+    as_array_with_scalar_flag,
+    convert_values,
+    restore_scalar_if_needed,
+)
+
+
+def available_property_keys(
+    property_keys: Iterable[str], *, density_ref: float | None = None
+) -> list[str]:
+    props = set(property_keys)
+    if {"k", "cp"}.issubset(props) and ("rho" in props or density_ref is not None):
+        props.add("diffusivity")
+    return sorted(props)
+
+
+class BoundDiffusivity:
+    """Derived diffusivity ``k / (rho * cp)`` over bound component curves.
+
+    Returned by ``Material.bind("diffusivity")`` when the material has no diffusivity
+    curve of its own; ``rho`` falls back to the material's ``density_ref``.
+    """
+
+    __slots__ = ("k", "cp", "rho", "density_ref", "units", "policy", "scale", "offset")
+
+    def __init__(
+        self,
+        k: BoundProperty,
+        cp: BoundProperty,
+        rho: BoundProperty | None,
+        density_ref: float | None,
+        *,
+        units: str | None = None,
+    ):
+        self.k = k
+        self.cp = cp
+        self.rho = rho
+        self.density_ref = density_ref
+        self.policy = k.policy
+        self.units = units or "m^2/s"
+        self.scale, self.offset = affine_conversion("m^2/s", self.units)
+
+    def __call__(self, T):
+        rho = self.rho(T) if self.rho is not None else self.density_ref
+        values = self.k(T) / (rho * self.cp(T))
+        if self.scale == 1.0 and self.offset == 0.0:
+            return values
+        return values * self.scale + self.offset
+
+    def __repr__(self) -> str:
+        return f"BoundDiffusivity(units={self.units!r}, policy={self.policy!r})"
 
 
 @dataclass
@@ -20,11 +72,14 @@ class Material:
     density_ref: float | None
     sources: list[SourceRef]
     _properties: dict
-    _source_lookup: dict[str, SourceRef]
+    _source_lookup: Mapping[str, SourceRef]
     _curve_cache: dict[str, PropertyCurve]
+    _reference_cache: dict[tuple[str, float, str | None], float] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @classmethod
-    def from_record(cls, record: dict, source_lookup: dict[str, SourceRef]) -> "Material":
+    def from_record(cls, record: dict, source_lookup: Mapping[str, SourceRef]) -> "Material":
         source_ids = record.get("sources", [])
         material_sources = [source_lookup[sid] for sid in source_ids if sid in source_lookup]
         return cls(
@@ -44,10 +99,7 @@ class Material:
         )
 
     def available_properties(self) -> list[str]:
-        props = set(self._properties.keys())
-        if self._can_compute_diffusivity():
-            props.add("diffusivity")
-        return sorted(props)
+        return available_property_keys(self._properties.keys(), density_ref=self.density_ref)
 
     def _can_compute_diffusivity(self) -> bool:
         if "diffusivity" in self._properties:
@@ -63,8 +115,30 @@ class Material:
             raise KeyError(f"Property not available for {self.id}: {property_key}")
 
         curve = curve_from_record(property_key, self._properties[property_key], self._source_lookup)
-        self._curve_cache[property_key] = curve
-        return curve
+        # setdefault publishes one instance even when two threads build the curve at once.
+        return self._curve_cache.setdefault(property_key, curve)
+
+    def bind(
+        self, property_key: str, *, units: str | None = None, policy: str | None = None
+    ) -> BoundProperty | BoundDiffusivity:
+        """Pre-resolve a property curve for repeated calls, e.g. ``mat.bind("k", units=...)``."""
+        if property_key == "eps_th":
+            raise ValueError("eps_th depends on T_ref; call Material.eps_th instead")
+        if property_key == "diffusivity" and "diffusivity" not in self._properties:
+            if not self._can_compute_diffusivity():
+                raise KeyError(
+                    f"Property not available for {self.id}: diffusivity "
+                    "(requires k(T), cp(T), and rho(T) or density_ref)"
+                )
+            rho = self.bind("rho", policy=policy) if "rho" in self._properties else None
+            return BoundDiffusivity(
+                self.bind("k", policy=policy),
+                self.bind("cp", policy=policy),
+                rho,
+                self.density_ref,
+                units=units,
+            )
+        return BoundProperty(self.curve(property_key), units=units, policy=policy)
 
     def _eval(self, property_key: str, T, *, units: str | None = None, policy: str | None = None):
         curve = self.curve(property_key)
@@ -105,6 +179,15 @@ class Material:
                 "(requires k(T), cp(T), and rho(T) or density_ref)"
             )
 
+        if isinstance(T, (float, int)):
+            k_value = self.k(T, policy=policy)
+            cp_value = self.cp(T, policy=policy)
+            if "rho" in self._properties:
+                rho_value = self.rho(T, policy=policy)
+            else:
+                rho_value = float(self.density_ref)
+            return convert_values(k_value / (rho_value * cp_value), "m^2/s", units)
+
         arr, was_scalar = as_array_with_scalar_flag(T)
         k_values = np.asarray(self.k(arr, policy=policy), dtype=float)
         cp_values = np.asarray(self.cp(arr, policy=policy), dtype=float)
@@ -118,6 +201,16 @@ class Material:
         values = restore_scalar_if_needed(values, was_scalar)
         return convert_values(values, "m^2/s", units)
 
+    def _reference_value(
+        self, property_key: str, T_ref: float, policy: str | None, evaluate: Callable
+    ) -> float:
+        key = (property_key, float(T_ref), policy)
+        value = self._reference_cache.get(key)
+        if value is None:
+            value = float(evaluate(float(T_ref), policy=policy))
+            value = self._reference_cache.setdefault(key, value)
+        return value
+
     def eps_th(
         self,
         T,
@@ -131,31 +224,20 @@ class Material:
             values = curve(T, policy=policy)
 
             if curve.reference_temperature is not None and abs(curve.reference_temperature - T_ref) > 1e-9:
-                ref_value = curve(T_ref, policy=policy)
-                values = np.asarray(values, dtype=float) - float(ref_value)
+                ref_value = self._reference_value("eps_th", T_ref, policy, curve)
+                values = np.asarray(values, dtype=float) - ref_value
 
             return convert_values(values, curve.units, units)
 
         if "alpha" not in self._properties:
             raise KeyError(f"Property not available for {self.id}: eps_th (and alpha missing)")
 
-        curve = self.curve("alpha")
-        arr = np.asarray(T, dtype=float)
-        was_scalar = arr.ndim == 0
-        arr = arr.reshape(1) if was_scalar else arr
-
-        out = np.zeros_like(arr, dtype=float)
-        if hasattr(np, "trapezoid"):
-            integrate = np.trapezoid
-        elif hasattr(np, "trapz"):
-            integrate = np.trapz
+        # eps_th(T) = F(T) - F(T_ref), with F the tabulated antiderivative of alpha.
+        antiderivative = self.curve("alpha").antiderivative()
+        values = antiderivative(T, policy=policy)
+        ref_value = self._reference_value("alpha", T_ref, policy, antiderivative)
+        if isinstance(values, np.ndarray):
+            values -= ref_value
         else:
-            raise RuntimeError("NumPy integration function unavailable (expected trapezoid or trapz)")
-        for i, t_i in enumerate(arr):
-            n_points = 64
-            grid = np.linspace(T_ref, t_i, n_points)
-            alpha_values = np.asarray(curve(grid, policy=policy), dtype=float)
-            out[i] = integrate(alpha_values, grid)
-
-        values = float(out[0]) if was_scalar else out
+            values = values - ref_value
         return convert_values(values, "1", units)
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+from .polynomial import horner, horner_scalar
+
+_LN10 = math.log(10.0)
+
 
 class LogPolynomialModel:
     def __init__(self, coefficients: list[float]):
-        if not coefficients:
+        if len(coefficients) == 0:
             raise ValueError("Log-polynomial coefficients cannot be empty")
         self.coefficients = np.asarray(coefficients, dtype=float)
+        # Horner order with ln(10) folded in, so 10**p(log10 T) is a single exp().
+        self._horner = tuple(float(c) * _LN10 for c in self.coefficients[::-1])
 
-    def evaluate(self, T: np.ndarray) -> np.ndarray:
+    def evaluate(self, T: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
         if np.any(T <= 0):
             raise ValueError("Log-polynomial model requires T > 0")
-        logT = np.log10(T)
-        out = np.zeros_like(logT, dtype=float)
-        power = np.ones_like(logT, dtype=float)
-        for a_i in self.coefficients:
-            out += a_i * power
-            power *= logT
-        return np.power(10.0, out)
+        out = horner(self._horner, np.log10(T), out)
+        return np.exp(out, out=out)
+
+    def evaluate_scalar(self, T: float) -> float:
+        if T <= 0:
+            raise ValueError("Log-polynomial model requires T > 0")
+        return math.exp(horner_scalar(self._horner, math.log10(T)))
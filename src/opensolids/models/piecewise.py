@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
 from dataclasses import dataclass
 
 import numpy as np
@@ -38,23 +40,118 @@ class PiecewiseBranch:
     model: object
 
 
+def _interior_point(lower: float, upper: float) -> float | None:
+    """A value strictly inside the open interval ``(lower, upper)``, if there is one."""
+    if lower == -math.inf and upper == math.inf:
+        return 0.0
+    if lower == -math.inf:
+        return upper - max(1.0, abs(upper))
+    if upper == math.inf:
+        return lower + max(1.0, abs(lower))
+    mid = lower + (upper - lower) / 2.0
+    return mid if lower < mid < upper else None
+
+
 class PiecewiseModel:
+    """First-matching-branch model, compiled to sorted breakpoints at build time.
+
+    The branch conditions are resolved once into segments of the temperature axis. A
+    segment starts at ``thresholds[k - 1]`` and covers ``T >= thresholds[k - 1]``; an
+    exclusive bound ``T > x`` is stored as ``nextafter(x, inf)``. ``owners`` maps each
+    segment to its branch, or -1 where no branch applies.
+    """
+
     def __init__(self, branches: list[PiecewiseBranch]):
         if not branches:
             raise ValueError("Piecewise model requires at least one branch")
         self.branches = branches
+        self._compile()
+
+    def _owner(self, value: float) -> int:
+        probe = np.array([value])
+        for i, branch in enumerate(self.branches):
+            if branch.condition.mask(probe)[0]:
+                return i
+        return -1
+
+    def _compile(self) -> None:
+        points = sorted(
+            {
+                float(bound)
+                for branch in self.branches
+                for bound in (branch.condition.lower, branch.condition.upper)
+                if bound is not None
+            }
+        )
+        # Elementary pieces in axis order: each open interval between breakpoints, then the
+        # breakpoint itself.
+        pieces: list[tuple[float, int]] = []
+        lower = -math.inf
+        for point in [*points, math.inf]:
+            interior = _interior_point(lower, point)
+            if interior is not None:
+                start = lower if lower == -math.inf else float(np.nextafter(lower, math.inf))
+                pieces.append((start, self._owner(interior)))
+            if point != math.inf:
+                pieces.append((point, self._owner(point)))
+            lower = point
+
+        thresholds: list[float] = []
+        owners = [pieces[0][1]]
+        for start, owner in pieces[1:]:
+            if owner != owners[-1]:
+                thresholds.append(start)
+                owners.append(owner)
+
+        self.thresholds = np.array(thresholds, dtype=float)
+        self.owners = np.array(owners, dtype=np.intp)
+        self._segments_are_branches = self.owners.tolist() == list(range(len(self.owners)))
+        self._threshold_list = self.thresholds.tolist()
+        self._owner_list = self.owners.tolist()
+        # NaN fails every comparison, so only a default branch can take it.
+        self._nan_owner = next(
+            (i for i, b in enumerate(self.branches) if b.condition.kind == "default"), -1
+        )
+
+    def _uncovered(self) -> ValueError:
+        return ValueError("Piecewise model did not assign all input temperatures")
 
     def evaluate(self, T: np.ndarray) -> np.ndarray:
-        out = np.full_like(T, np.nan, dtype=float)
-        assigned = np.zeros_like(T, dtype=bool)
+        T = np.asarray(T, dtype=float)
+        flat = T.reshape(-1)
+        out = np.empty(flat.shape, dtype=float)
 
-        for branch in self.branches:
-            mask = branch.condition.mask(T) & (~assigned)
-            if np.any(mask):
-                out[mask] = branch.model.evaluate(T[mask])
-                assigned[mask] = True
+        if flat.size > 1 and np.all(flat[1:] >= flat[:-1]):
+            # Sorted sweep (no NaN): each segment is one contiguous slice of the input.
+            edges = [0, *np.searchsorted(flat, self.thresholds, side="left").tolist(), flat.size]
+            for owner, start, stop in zip(self.owners.tolist(), edges[:-1], edges[1:]):
+                if start == stop:
+                    continue
+                if owner < 0:
+                    raise self._uncovered()
+                out[start:stop] = self.branches[owner].model.evaluate(flat[start:stop])
+            return out.reshape(T.shape)
 
-        if not np.all(assigned):
-            raise ValueError("Piecewise model did not assign all input temperatures")
+        owner_of = np.searchsorted(self.thresholds, flat, side="right")
+        if not self._segments_are_branches:
+            owner_of = self.owners[owner_of]
+        # min() propagates NaN, so clean inputs skip building a NaN mask.
+        if flat.size and np.isnan(flat.min()):
+            owner_of[np.isnan(flat)] = self._nan_owner
+        for owner in sorted(set(self.owners.tolist()) | {self._nan_owner}):
+            mask = owner_of == owner
+            if not mask.any():
+                continue
+            if owner < 0:
+                raise self._uncovered()
+            out[mask] = self.branches[owner].model.evaluate(flat[mask])
+        return out.reshape(T.shape)
 
-        return out
+    def evaluate_scalar(self, T: float) -> float:
+        if T != T:
+            owner = self._nan_owner
+        else:
+            owner = self._owner_list[bisect_right(self._threshold_list, T)]
+        if owner < 0:
+            raise self._uncovered()
+        return self.branches[owner].model.evaluate_scalar(T)
@@ -3,16 +3,37 @@ from __future__ import annotations
 import numpy as np
 
 
+def horner(coefficients: tuple[float, ...], x: np.ndarray, out: np.ndarray | None = None):
+    """Evaluate ``sum(c_i * x**i)`` in place; ``coefficients`` are highest order first.
+
+    ``out`` must not share memory with ``x``.
+    """
+    if out is None:
+        out = np.full(x.shape, coefficients[0], dtype=float)
+    else:
+        out[...] = coefficients[0]
+    for c in coefficients[1:]:
+        out *= x
+        out += c
+    return out
+
+
+def horner_scalar(coefficients: tuple[float, ...], x: float) -> float:
+    out = coefficients[0]
+    for c in coefficients[1:]:
+        out = out * x + c
+    return out
+
+
 class PolynomialModel:
     def __init__(self, coefficients: list[float]):
-        if not coefficients:
+        if len(coefficients) == 0:
             raise ValueError("Polynomial coefficients cannot be empty")
         self.coefficients = np.asarray(coefficients, dtype=float)
+        self._horner = tuple(float(c) for c in self.coefficients[::-1])
+
+    def evaluate(self, T: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        return horner(self._horner, np.asarray(T, dtype=float), out)
 
-    def evaluate(self, T: np.ndarray) -> np.ndarray:
-        out = np.zeros_like(T, dtype=float)
-        power = np.ones_like(T, dtype=float)
-        for a_i in self.coefficients:
-            out += a_i * power
-            power *= T
-        return out
+    def evaluate_scalar(self, T: float) -> float:
+        return horner_scalar(self._horner, T)
@@ -1,7 +1,41 @@
 from __future__ import annotations
 
+import math
+from bisect import bisect_right
+
 import numpy as np
-from scipy.interpolate import PchipInterpolator, interp1d
+
+# Below this many points the sortedness check costs more than it saves.
+_SORTED_PATH_MIN_SIZE = 4096
+
+
+def _pchip_edge_slope(h0: float, h1: float, m0: float, m1: float) -> float:
+    # Non-centered three-point end condition, limited to keep the end monotone.
+    d = ((2.0 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    if np.sign(d) != np.sign(m0):
+        return 0.0
+    if np.sign(m0) != np.sign(m1) and abs(d) > 3.0 * abs(m0):
+        return 3.0 * m0
+    return d
+
+
+def pchip_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Shape-preserving (Fritsch-Carlson, weighted harmonic mean) knot derivatives."""
+    h = np.diff(x)
+    m = np.diff(y) / h
+    if len(x) == 2:
+        return np.array([m[0], m[0]])
+
+    d = np.empty_like(x)
+    w1 = 2.0 * h[1:] + h[:-1]
+    w2 = h[1:] + 2.0 * h[:-1]
+    flat = (np.sign(m[1:]) != np.sign(m[:-1])) | (m[1:] == 0.0) | (m[:-1] == 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d[1:-1] = (w1 + w2) / (w1 / m[:-1] + w2 / m[1:])
+    d[1:-1][flat] = 0.0
+    d[0] = _pchip_edge_slope(h[0], h[1], m[0], m[1])
+    d[-1] = _pchip_edge_slope(h[-1], h[-2], m[-1], m[-2])
+    return d
 
 
 class TabularModel:
@@ -18,18 +52,98 @@ class TabularModel:
             raise ValueError("Tabular temperatures must be strictly increasing")
 
         self.interpolation = interpolation
-        self._linear = interp1d(
-            self.T,
-            self.y,
-            kind="linear",
-            fill_value="extrapolate",
-            assume_sorted=True,
-        )
-        self._pchip = PchipInterpolator(self.T, self.y, extrapolate=True)
+        # Built on first use, for the one interpolation mode the curve actually uses.
+        self._pchip_coefficients: tuple[np.ndarray, ...] | None = None
+        self._scalar_table: tuple[list[float], ...] | None = None
+
+    def _evaluate_linear(self, T: np.ndarray) -> np.ndarray:
+        x, y = self.T, self.y
+        out = np.interp(T, x, y)
+        if T.size == 0:
+            return out
+        # np.interp holds the end values; extend the end segments linearly instead. Masks
+        # rather than min()/max(): a NaN anywhere would make both range checks False.
+        below = T < x[0]
+        if below.any():
+            out[below] = y[0] + (T[below] - x[0]) * ((y[1] - y[0]) / (x[1] - x[0]))
+        above = T > x[-1]
+        if above.any():
+            out[above] = y[-1] + (T[above] - x[-1]) * ((y[-1] - y[-2]) / (x[-1] - x[-2]))
+        return out
+
+    def _pchip(self) -> tuple[np.ndarray, ...]:
+        if self._pchip_coefficients is None:
+            x, y = self.T, self.y
+            h = np.diff(x)
+            m = np.diff(y) / h
+            d = pchip_slopes(x, y)
+            # Cubic Hermite segment i in powers of (T - x_i), highest order first.
+            c3 = (d[:-1] + d[1:] - 2.0 * m) / h**2
+            c2 = (3.0 * m - 2.0 * d[:-1] - d[1:]) / h
+            self._pchip_coefficients = (c3, c2, d[:-1].copy(), y[:-1])
+        return self._pchip_coefficients
+
+    def _segment_index(self, T: np.ndarray) -> np.ndarray:
+        # Counting interior knots <= T gives the segment directly, with the end segments
+        # extended past the table (PchipInterpolator(extrapolate=True) behaviour).
+        interior = self.T[1:-1]
+        flat = T.reshape(-1)
+        if flat.size >= _SORTED_PATH_MIN_SIZE and np.all(flat[1:] >= flat[:-1]):
+            # Sorted sweep: segment runs follow from where each knot falls in T.
+            knots = np.searchsorted(flat, interior, side="right")
+            counts = np.diff(knots, prepend=0, append=flat.size)
+            return np.repeat(np.arange(len(self.T) - 1), counts).reshape(T.shape)
+        return np.searchsorted(interior, T, side="right")
+
+    def _evaluate_pchip(self, T: np.ndarray) -> np.ndarray:
+        c3, c2, c1, c0 = self._pchip()
+        i = self._segment_index(T)
+        # Fresh large temporaries dominate at this size, so gathers reuse two buffers.
+        # mode="clip" lets take() write into out= unbuffered; indices are in range anyway.
+        t = self.T.take(i, mode="clip")
+        np.subtract(T, t, out=t)
+        scratch = np.empty_like(t)
+        out = c3.take(i, mode="clip")
+        for c in (c2, c1, c0):
+            out *= t
+            out += c.take(i, out=scratch, mode="clip")
+        return out
 
     def evaluate(self, T: np.ndarray) -> np.ndarray:
+        T = np.asarray(T, dtype=float)
         if self.interpolation == "linear":
-            return np.asarray(self._linear(T), dtype=float)
+            return self._evaluate_linear(T)
         if self.interpolation == "pchip":
-            return np.asarray(self._pchip(T), dtype=float)
+            return self._evaluate_pchip(T)
         raise ValueError(f"Unsupported interpolation: {self.interpolation}")
+
+    def _scalar_tables(self) -> tuple[list[float], ...]:
+        # Plain-float copies: bisect and float arithmetic beat numpy for one point.
+        if self._scalar_table is None:
+            if self.interpolation == "pchip":
+                c3, c2, c1, c0 = self._pchip()
+                self._scalar_table = (
+                    self.T.tolist(), c3.tolist(), c2.tolist(), c1.tolist(), c0.tolist()
+                )
+            else:
+                self._scalar_table = (self.T.tolist(), self.y.tolist())
+        return self._scalar_table
+
+    def evaluate_scalar(self, T: float) -> float:
+        if self.interpolation not in ("linear", "pchip"):
+            raise ValueError(f"Unsupported interpolation: {self.interpolation}")
+        if T != T:
+            return math.nan
+        if self.interpolation == "pchip":
+            x, c3, c2, c1, c0 = self._scalar_tables()
+            i = min(max(bisect_right(x, T) - 1, 0), len(x) - 2)
+            t = T - x[i]
+            return ((c3[i] * t + c2[i]) * t + c1[i]) * t + c0[i]
+
+        x, y = self._scalar_tables()
+        if T >= x[-1]:
+            if T == x[-1]:
+                return y[-1]
+            return y[-1] + (T - x[-1]) * ((y[-1] - y[-2]) / (x[-1] - x[-2]))
+        i = max(bisect_right(x, T) - 1, 0)
+        return ((y[i + 1] - y[i]) / (x[i + 1] - x[i])) * (T - x[i]) + y[i]
@@ -16,6 +16,14 @@ def validate_policy(policy: str | None) -> Policy:
     return policy  # type: ignore[return-value]
 
 
+def out_of_range_error(
+    valid_T_min: float, valid_T_max: float, tmin: float, tmax: float
+) -> ValueError:
+    return ValueError(
+        f"Temperature out of range [{valid_T_min}, {valid_T_max}] K: [{tmin}, {tmax}]"
+    )
+
+
 def apply_temperature_policy(
     T: np.ndarray,
     valid_T_min: float,
@@ -25,13 +33,10 @@ def apply_temperature_policy(
     if policy == "extrapolate":
         return T
 
-    out_of_range = (T < valid_T_min) | (T > valid_T_max)
-    if policy == "raise" and np.any(out_of_range):
-        tmin = float(np.min(T))
-        tmax = float(np.max(T))
-        raise ValueError(
-            f"Temperature out of range [{valid_T_min}, {valid_T_max}] K: [{tmin}, {tmax}]"
-        )
+    if policy == "raise":
+        if np.any((T < valid_T_min) | (T > valid_T_max)):
+            raise out_of_range_error(valid_T_min, valid_T_max, float(np.min(T)), float(np.max(T)))
+        return T
 
     if policy == "clamp":
         return np.clip(T, valid_T_min, valid_T_max)
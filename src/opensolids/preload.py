@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .registry import ProviderRegistry, _build_default_registry, default_registry
+
+_SMAPS_ROLLUP = Path("/proc/self/smaps_rollup")
+
+
+@dataclass(frozen=True)
+class PreloadReport:
+    materials: int
+    curves: int
+    interned_strings: int
+    seconds: float
+    frozen: bool
+
+
+@dataclass(frozen=True)
+class WorkerMemory:
+    mode: str
+    rss_kb: int
+    pss_kb: int
+    uss_kb: int
+
+
+@dataclass(frozen=True)
+class ForkSharingReport:
+    preloaded: list[WorkerMemory]
+    cold: list[WorkerMemory]
+
+    @staticmethod
+    def _mean(values: list[int]) -> float:
+        return sum(values) / len(values) if values else 0.0
+
+    @property
+    def rss_saved_kb(self) -> float:
+        return self._mean([w.rss_kb for w in self.cold]) - self._mean(
+            [w.rss_kb for w in self.preloaded]
+        )
+
+    @property
+    def uss_saved_kb(self) -> float:
+        return self._mean([w.uss_kb for w in self.cold]) - self._mean(
+            [w.uss_kb for w in self.preloaded]
+        )
+
+
+def _intern(value: Any, counter: list[int]) -> Any:
+    if isinstance(value, str):
+        counter[0] += 1
+        return sys.intern(value)
+    if isinstance(value, dict):
+        # Rebuilt rather than edited: records already handed out (and the curve records
+        # canonical materials share with them) must not change under their holders.
+        counter[0] += len(value)
+        return {
+            sys.intern(key) if isinstance(key, str) else key: _intern(item, counter)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern(item, counter) for item in value]
+    return value
+
+
+def _intern_provider_records(registry: ProviderRegistry) -> int:
+    """Replace each provider's record dicts with interned copies; returns strings interned."""
+    counter = [0]
+    for provider in registry.providers.values():
+        for attr in ("_materials", "_index"):
+            records = getattr(provider, attr, None)
+            if isinstance(records, dict):
+                setattr(provider, attr, _intern(records, counter))
+    return counter[0]
+
+
+def _all_material_ids(registry: ProviderRegistry) -> list[str]:
+    ids = registry.list_canonical_material_ids()
+    for name in registry.list_providers():
+        ids.extend(registry.providers[name].list_material_ids())
+    return ids
+
+
+def preload(
+    registry: ProviderRegistry | None = None,
+    *,
+    freeze: bool = True,
+    keep_resident: bool = True,
+) -> PreloadReport:
+    """Materialize every material and curve of ``registry`` ahead of forking workers.
+
+    Packs are loaded and validated, provider records are replaced by copies with interned
+    strings (records callers already hold are left untouched), every canonical and
+    provider material is built with all of its curves and the search indexes are built.
+    With ``keep_resident`` the registry's ``material_cache_size`` is permanently raised
+    to hold every material, overriding the configured LRU bound; otherwise materials
+    beyond that bound are evicted again and rebuilt on demand in each child.
+    With ``freeze`` the heap is then moved to the permanent GC generation
+    (``gc.freeze()``), so collections in forked children do not touch, and thereby copy,
+    the shared pages. Call it once in the parent, before any worker threads start.
+    """
+    reg = registry or default_registry()
+    start = time.perf_counter()
+
+    reg.warm_up()
+    interned = _intern_provider_records(reg)
+
+    material_ids = _all_material_ids(reg)
+    if keep_resident:
+        reg.material_cache_size = max(reg.material_cache_size, len(material_ids))
+    curves = 0
+    for material_id in material_ids:
+        mat = reg.material(material_id)
+        for property_key in mat._properties:
+            mat.curve(property_key)
+            curves += 1
+
+    reg.material_index()
+    reg.canonical_summary_index()
+    reg.provider_summary_index()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return PreloadReport(
+        materials=len(material_ids),
+        curves=curves,
+        interned_strings=interned,
+        seconds=time.perf_counter() - start,
+        frozen=freeze,
+    )
+
+
+def _read_memory(mode: str) -> WorkerMemory:
+    fields: dict[str, int] = {}
+    for line in _SMAPS_ROLLUP.read_text().splitlines()[1:]:
+        key, _, rest = line.partition(":")
+        parts = rest.split()
+        if parts and parts[0].isdigit():
+            fields[key] = int(parts[0])
+    return WorkerMemory(
+        mode=mode,
+        rss_kb=fields.get("Rss", 0),
+        pss_kb=fields.get("Pss", 0),
+        uss_kb=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    )
+
+
+def _exercise(registry: ProviderRegistry) -> None:
+    for material_id in _all_material_ids(registry):
+        mat = registry.material(material_id)
+        for property_key in mat._properties:
+            curve = mat.curve(property_key)
+            curve(curve.valid_T_min)
+
+
+def _fork_worker(mode: str, work: Callable[[], None]) -> tuple[int, int]:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        status = 1
+        try:
+            os.close(read_fd)
+            work()
+            payload = json.dumps(_read_memory(mode).__dict__).encode()
+            os.write(write_fd, payload)
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    return pid, read_fd
+
+
+def _collect_worker(pid: int, read_fd: int) -> WorkerMemory | None:
+    with os.fdopen(read_fd, "rb") as fh:
+        payload = fh.read()
+    _, status = os.waitpid(pid, 0)
+    if status != 0 or not payload:
+        return None
+    return WorkerMemory(**json.loads(payload))
+
+
+def measure_fork_sharing(
+    workers: int = 4,
+    *,
+    factory: Callable[[], ProviderRegistry] = _build_default_registry,
+) -> ForkSharingReport:
+    """Fork workers from a preloaded parent and from a cold start; report their memory.
+
+    Each "preloaded" child exercises every curve of the parent's frozen registry; each
+    "cold" child builds and preloads its own registry, as a worker without preloading
+    would. Memory is read from ``/proc/self/smaps_rollup`` (Linux only); USS is the
+    private (clean + dirty) part of RSS. Every child is reaped and, unless the heap was
+    already frozen on entry, it is unfrozen again before returning or raising.
+    """
+    if not hasattr(os, "fork") or not _SMAPS_ROLLUP.exists():
+        raise RuntimeError("Fork sharing measurement requires Linux with /proc/self/smaps_rollup")
+
+    was_frozen = gc.get_freeze_count() > 0
+    children: dict[int, int] = {}
+    try:
+        registry = factory()
+        preload(registry)
+
+        def cold() -> None:
+            child = factory()
+            preload(child, freeze=False)
+            _exercise(child)
+
+        for _ in range(workers):
+            pid, read_fd = _fork_worker("preloaded", lambda: _exercise(registry))
+            children[pid] = read_fd
+        for _ in range(workers):
+            pid, read_fd = _fork_worker("cold", cold)
+            children[pid] = read_fd
+
+        results: dict[str, list[WorkerMemory]] = {"preloaded": [], "cold": []}
+        failed: list[int] = []
+        for pid in list(children):
+            memory = _collect_worker(pid, children.pop(pid))
+            if memory is None:
+                failed.append(pid)
+            else:
+                results[memory.mode].append(memory)
+        if failed:
+            raise RuntimeError(f"Measurement workers failed: {failed}")
+        return ForkSharingReport(preloaded=results["preloaded"], cold=results["cold"])
+    finally:
+        # Only reached with children left if forking or collection itself failed.
+        for pid, read_fd in children.items():
+            with contextlib.suppress(OSError):
+                os.close(read_fd)
+            os.waitpid(pid, 0)
+        if not was_frozen:
+            gc.unfreeze()
@@ -2,10 +2,12 @@ from .curated_public.provider import CuratedPublicProvider
 from .mil_hdbk_5.provider import MilHdbk5Provider
 from .nist_cryo.provider import NISTCryoProvider
 from .ntrs_openapi.provider import NTRSOpenAPIProvider
+from .sqlite.provider import SQLiteProvider
 
 __all__ = [
     "CuratedPublicProvider",
     "NISTCryoProvider",
     "NTRSOpenAPIProvider",
     "MilHdbk5Provider",
+    "SQLiteProvider",
 ]
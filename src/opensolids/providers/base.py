@@ -1,13 +1,83 @@
 from __future__ import annotations
 
 import importlib
+import importlib.resources
 import json
+import threading
+import zipimport
 from pathlib import Path
 from typing import Protocol
 
-from opensolids.search import matches_query
+from opensolids.material import available_property_keys
+from opensolids.providers.compiled_pack import (
+    COMPILED_PACK_FILENAME,
+    compiled_pack_is_fresh,
+    load_compiled_pack,
+)
+from opensolids.providers.pack_reader import (
+    DirectoryPackReader,
+    PackReader,
+    TraversablePackReader,
+    ZipPackReader,
+    reader_for_path,
+)
+from opensolids.search import TextIndex
 from opensolids.types import MaterialSummary, SourceRef
-from opensolids.validation import validate_material_record
+from opensolids.validation import ValidationCache, default_validation_cache
+
+
+def material_index_entry(rec: dict, file: str | None = None, size: int | None = None) -> dict:
+    entry = {
+        "file": file,
+        "name": rec["name"],
+        "aliases": list(rec.get("aliases", [])),
+        "condition": rec.get("condition"),
+        "sources": list(rec.get("sources", [])),
+        "properties": sorted(rec.get("properties", {}).keys()),
+    }
+    if rec.get("density_ref") is not None:
+        entry["density_ref"] = float(rec["density_ref"])
+    if size is not None:
+        entry["size"] = size
+    return entry
+
+
+def build_pack_index(base: Path) -> dict[str, dict]:
+    """ID -> {file, size, name, aliases, condition, sources, properties} index for a manifest."""
+    materials_dir = base / "materials"
+    if not materials_dir.exists():
+        return {}
+    index: dict[str, dict] = {}
+    for fp in sorted(materials_dir.glob("*.json")):
+        payload = fp.read_bytes()
+        rec = json.loads(payload)
+        index[rec["id"]] = material_index_entry(
+            rec, fp.relative_to(base).as_posix(), size=len(payload)
+        )
+    return dict(sorted(index.items()))
+
+
+def write_pack_index(base: Path) -> dict:
+    fp = base / "manifest.json"
+    manifest = json.loads(fp.read_text()) if fp.exists() else {}
+    manifest["materials"] = build_pack_index(base)
+    fp.write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def source_ref_from_record(rec: dict) -> SourceRef:
+    return SourceRef(
+        source_id=rec["source_id"],
+        title=rec["title"],
+        publisher=rec["publisher"],
+        organization=rec.get("organization"),
+        url_or_citation_id=rec["url_or_citation_id"],
+        license_notes=rec.get("license_notes", ""),
+        retrieved_at=rec["retrieved_at"],
+        page_or_table=rec.get("page_or_table"),
+        extraction_method=rec.get("extraction_method", "manual"),
+        metadata=rec.get("metadata", {}),
+    )
 
 
 class Provider(Protocol):
@@ -43,10 +113,20 @@ class LocalDataPackProvider:
         self.version = version
         self.package_name = package_name
         self.fallback_path = fallback_path
+        self.validation_cache: ValidationCache | None = None
 
+        # Guards the lazy loads below; fast paths check the published state without it.
+        self._lock = threading.RLock()
         self._loaded = False
+        self._sources_loaded = False
+        self._reader: PackReader | None = None
+        self._compiled_fresh: bool | None = None
+        self._manifest: dict | None = None
+        self._index: dict[str, dict] | None = None
         self._materials: dict[str, dict] = {}
         self._sources: dict[str, SourceRef] = {}
+        self._text_index = TextIndex()
+        self._indexed_ids: list[str] = []
 
     def _resolve_base_path(self) -> Path:
         try:
@@ -59,76 +139,219 @@ class LocalDataPackProvider:
 
         return self.fallback_path
 
+    def _open_pack_reader(self) -> PackReader:
+        try:
+            module = importlib.import_module(self.package_name)
+        except ModuleNotFoundError:
+            return reader_for_path(self.fallback_path)
+
+        loader = getattr(module, "__loader__", None)
+        module_file = getattr(module, "__file__", None)
+        if isinstance(loader, zipimport.zipimporter) and module_file:
+            archive = Path(loader.archive)
+            prefix = Path(module_file).parent.relative_to(archive).as_posix()
+            return ZipPackReader(archive, prefix)
+        if module_file and Path(module_file).parent.is_dir():
+            return DirectoryPackReader(Path(module_file).resolve().parent)
+        if getattr(module, "__path__", None) is not None:
+            return TraversablePackReader(importlib.resources.files(self.package_name))
+        return reader_for_path(self.fallback_path)
+
+    def _pack_reader(self) -> PackReader:
+        if self._reader is None:
+            with self._lock:
+                if self._reader is None:
+                    self._reader = self._open_pack_reader()
+        return self._reader
+
+    def manifest(self) -> dict:
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    reader = self._pack_reader()
+                    exists = reader.exists("manifest.json")
+                    payload = reader.read_bytes("manifest.json") if exists else b"{}"
+                    self._manifest = json.loads(payload)
+        return self._manifest
+
+    def _has_fresh_compiled_pack(self) -> bool:
+        # Checked once per provider; both the index and the record load consult it.
+        if self._compiled_fresh is None:
+            with self._lock:
+                if self._compiled_fresh is None:
+                    reader = self._pack_reader()
+                    exists = reader.exists(COMPILED_PACK_FILENAME)
+                    self._compiled_fresh = exists and compiled_pack_is_fresh(reader)
+        return self._compiled_fresh
+
+    def _manifest_index(self) -> dict[str, dict] | None:
+        if self._has_fresh_compiled_pack():
+            return None
+
+        reader = self._pack_reader()
+        entries = self.manifest().get("materials")
+        if not isinstance(entries, dict):
+            return None
+        # A manifest out of step with the materials directory cannot be trusted for lookups:
+        # every file needs an entry, and a size change means the record was edited since.
+        # Sizes rather than mtimes, because mtimes do not survive git checkouts or installs.
+        files = reader.list_json("materials")
+        if files:
+            sizes = {entry.get("file"): entry.get("size") for entry in entries.values()}
+            if sizes.keys() != set(files):
+                return None
+            if any(sizes[name] != reader.size(name) for name in files):
+                return None
+        return entries
+
+    def _ensure_index(self) -> None:
+        if self._index is not None:
+            return
+
+        with self._lock:
+            if self._index is not None:
+                return
+            entries = self._manifest_index()
+            if entries is None:
+                self._ensure_loaded()
+                entries = {
+                    rec_id: material_index_entry(rec) for rec_id, rec in self._materials.items()
+                }
+
+            for material_id, entry in entries.items():
+                self._indexed_ids.append(material_id)
+                self._text_index.add(
+                    entry.get("name"),
+                    material_id,
+                    entry.get("condition"),
+                    *entry.get("aliases", []),
+                )
+            # Published last: readers that see the index also see the text index behind it.
+            self._index = entries
+
+    def _read_material_file(self, name: str) -> dict:
+        payload = self._pack_reader().read_bytes(name)
+        rec = json.loads(payload)
+        (self.validation_cache or default_validation_cache()).validate(payload, rec)
+        return rec
+
+    def _read_sources(self) -> list[dict]:
+        reader = self._pack_reader()
+        source_records: list[dict] = []
+        for name in reader.list_json("sources"):
+            payload = json.loads(reader.read_bytes(name))
+            source_records.extend(payload if isinstance(payload, list) else [payload])
+        return source_records
+
+    def _read_json_pack(self) -> tuple[list[dict], list[dict]]:
+        material_records = [
+            self._read_material_file(name) for name in self._pack_reader().list_json("materials")
+        ]
+        return material_records, self._read_sources()
+
+    def _load_compiled_pack(self) -> tuple[list[dict], list[dict]] | None:
+        if not self._has_fresh_compiled_pack():
+            return None
+        reader = self._pack_reader()
+        path = reader.local_path(COMPILED_PACK_FILENAME)
+        return load_compiled_pack(path or reader.read_bytes(COMPILED_PACK_FILENAME))
+
     def _ensure_loaded(self) -> None:
         if self._loaded:
             return
 
-        base = self._resolve_base_path()
-        materials_dir = base / "materials"
-        sources_dir = base / "sources"
-
-        if sources_dir.exists():
-            for fp in sorted(sources_dir.glob("*.json")):
-                payload = json.loads(fp.read_text())
-                if isinstance(payload, list):
-                    records = payload
-                else:
-                    records = [payload]
-                for rec in records:
-                    self._sources[rec["source_id"]] = SourceRef(
-                        source_id=rec["source_id"],
-                        title=rec["title"],
-                        publisher=rec["publisher"],
-                        organization=rec.get("organization"),
-                        url_or_citation_id=rec["url_or_citation_id"],
-                        license_notes=rec.get("license_notes", ""),
-                        retrieved_at=rec["retrieved_at"],
-                        page_or_table=rec.get("page_or_table"),
-                        extraction_method=rec.get("extraction_method", "manual"),
-                        metadata=rec.get("metadata", {}),
-                    )
-
-        if materials_dir.exists():
-            for fp in sorted(materials_dir.glob("*.json")):
-                rec = json.loads(fp.read_text())
-                validate_material_record(rec)
-                self._materials[rec["id"]] = rec
-
-        self._loaded = True
+        with self._lock:
+            if self._loaded:
+                return
+            compiled = self._load_compiled_pack()
+            if compiled is not None:
+                material_records, source_records = compiled
+            else:
+                material_records, source_records = self._read_json_pack()
 
-    def has_material(self, material_id: str) -> bool:
+            self._sources = {
+                rec["source_id"]: source_ref_from_record(rec) for rec in source_records
+            }
+            for rec in material_records:
+                self._materials.setdefault(rec["id"], rec)
+
+            self._sources_loaded = True
+            self._loaded = True
+
+    def _ensure_sources(self) -> None:
+        if self._sources_loaded:
+            return
+        with self._lock:
+            if self._sources_loaded:
+                return
+            self._ensure_index()
+            if not self._loaded:
+                self._sources = {
+                    rec["source_id"]: source_ref_from_record(rec) for rec in self._read_sources()
+                }
+            self._sources_loaded = True
+
+    def preload(self) -> None:
+        """Read and validate every record in the pack."""
         self._ensure_loaded()
-        return material_id in self._materials
+
+    def has_material(self, material_id: str) -> bool:
+        self._ensure_index()
+        assert self._index is not None
+        return material_id in self._index
 
     def get_material_record(self, material_id: str) -> dict:
-        self._ensure_loaded()
-        return self._materials[material_id]
+        rec = self._materials.get(material_id)
+        if rec is not None:
+            return rec
+
+        self._ensure_index()
+        assert self._index is not None
+        file = self._index[material_id].get("file")
+        if file is None:
+            self._ensure_loaded()
+            return self._materials[material_id]
+
+        with self._lock:
+            rec = self._materials.get(material_id)
+            if rec is None:
+                rec = self._read_material_file(file)
+                self._materials[material_id] = rec
+        return rec
 
     def list_material_ids(self) -> list[str]:
-        self._ensure_loaded()
-        return sorted(self._materials.keys())
+        self._ensure_index()
+        assert self._index is not None
+        return sorted(self._index.keys())
 
     def source_lookup(self) -> dict[str, SourceRef]:
-        self._ensure_loaded()
+        self._ensure_sources()
         return dict(self._sources)
 
     def search(self, query: str) -> list[MaterialSummary]:
-        self._ensure_loaded()
+        self._ensure_index()
+        assert self._index is not None
         out: list[MaterialSummary] = []
 
-        for rec in self._materials.values():
-            aliases = rec.get("aliases", [])
-            if matches_query(query, rec.get("name"), rec.get("id"), rec.get("condition"), *aliases):
-                out.append(
-                    MaterialSummary(
-                        id=rec["id"],
-                        name=rec["name"],
-                        provider=self.name,
-                        condition=rec.get("condition"),
-                        aliases=tuple(aliases),
-                        source_count=len(rec.get("sources", [])),
-                        property_coverage=tuple(sorted(rec.get("properties", {}).keys())),
-                    )
+        for doc in self._text_index.search(query):
+            material_id = self._indexed_ids[doc]
+            entry = self._index[material_id]
+            aliases = entry.get("aliases", [])
+            out.append(
+                MaterialSummary(
+                    id=material_id,
+                    name=entry["name"],
+                    provider=self.name,
+                    condition=entry.get("condition"),
+                    aliases=tuple(aliases),
+                    source_count=len(entry.get("sources", [])),
+                    property_coverage=tuple(
+                        available_property_keys(
+                            entry.get("properties", []),
+                            density_ref=entry.get("density_ref"),
+                        )
+                    ),
                 )
+            )
 
         return out
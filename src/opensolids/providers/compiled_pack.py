@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from opensolids.providers.pack_reader import DirectoryPackReader, PackReader
+from opensolids.validation import validate_material_record
+
+COMPILED_PACK_FILENAME = "pack.ospack"
+COMPILED_PACK_MAGIC = b"OSPACK\x00\x01"
+COMPILED_PACK_FORMAT_VERSION = 1
+
+_ARRAY_KEYS = {"T", "y", "coefficients"}
+_ARRAY_REF = "__array__"
+# magic, source fingerprint (hex sha256, zero-filled if none), header JSON length
+_HEADER = struct.Struct("<8s64sQ")
+_ALIGNMENT = 64
+
+
+def _as_reader(base: Path | PackReader) -> PackReader:
+    return DirectoryPackReader(base) if isinstance(base, Path) else base
+
+
+def _pack_files(reader: PackReader) -> list[str]:
+    return reader.list_json("materials") + reader.list_json("sources")
+
+
+def pack_fingerprint(base: Path | PackReader) -> str | None:
+    """Digest of the pack's JSON file names and signatures (size and mtime, or zip CRC).
+
+    Only stat data is used, so checking a compiled pack for freshness reads no JSON.
+    """
+    reader = _as_reader(base)
+    files = _pack_files(reader)
+    if not files:
+        return None
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update(name.encode())
+        digest.update(b"\x00")
+        digest.update(reader.signature(name).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def _extract_arrays(model: dict[str, Any], chunks: list[np.ndarray], offset: list[int]) -> dict:
+    out: dict[str, Any] = {}
+    for key, value in model.items():
+        if key in _ARRAY_KEYS and isinstance(value, (list, tuple, np.ndarray)):
+            arr = np.asarray(value, dtype="<f8")
+            out[key] = {_ARRAY_REF: [offset[0], int(arr.size)]}
+            chunks.append(arr)
+            offset[0] += int(arr.size)
+        elif key == "branches" and isinstance(value, (list, tuple)):
+            out[key] = [
+                {**branch, "model": _extract_arrays(branch["model"], chunks, offset)}
+                for branch in value
+            ]
+        else:
+            out[key] = value
+    return out
+
+
+def encode_pack(
+    materials: list[dict], sources: list[dict], fingerprint: str | None = None
+) -> bytes:
+    """Serialize records to the compiled pack layout.
+
+    Records are stored as one JSON header; every tabular/coefficient array is moved into
+    one contiguous little-endian float64 block so loaders can map it without copying.
+    """
+    chunks: list[np.ndarray] = []
+    offset = [0]
+    stored = [
+        {
+            **rec,
+            "properties": {
+                key: {**curve, "model": _extract_arrays(curve["model"], chunks, offset)}
+                for key, curve in rec["properties"].items()
+            },
+        }
+        for rec in materials
+    ]
+    header = json.dumps(
+        {
+            "format_version": COMPILED_PACK_FORMAT_VERSION,
+            "materials": stored,
+            "sources": sources,
+        },
+        separators=(",", ":"),
+    ).encode()
+    data_start = _HEADER.size + len(header)
+    padding = (-data_start) % _ALIGNMENT
+    return b"".join(
+        [
+            _HEADER.pack(COMPILED_PACK_MAGIC, (fingerprint or "").encode(), len(header)),
+            header,
+            b"\x00" * padding,
+            *(chunk.tobytes() for chunk in chunks),
+        ]
+    )
+
+
+def compile_pack(base: Path, output: Path | None = None) -> dict:
+    """Validate a JSON data pack and write it as a single compiled file."""
+    output = output or base / COMPILED_PACK_FILENAME
+    reader = DirectoryPackReader(base)
+
+    materials: list[dict] = []
+    sources: list[dict] = []
+    for name in _pack_files(reader):
+        payload = json.loads(reader.read_bytes(name))
+        if name.startswith("sources/"):
+            sources.extend(payload if isinstance(payload, list) else [payload])
+            continue
+        validate_material_record(payload)
+        materials.append(payload)
+
+    output.write_bytes(encode_pack(materials, sources, pack_fingerprint(reader)))
+
+    return {
+        "output": str(output),
+        "materials": len(materials),
+        "sources": len(sources),
+        "array_values": sum(
+            _array_value_count(curve["model"])
+            for rec in materials
+            for curve in rec["properties"].values()
+        ),
+        "bytes": output.stat().st_size,
+    }
+
+
+def _array_value_count(model: dict[str, Any]) -> int:
+    count = sum(len(model[key]) for key in _ARRAY_KEYS if key in model)
+    return count + sum(_array_value_count(branch["model"]) for branch in model.get("branches", []))
+
+
+def _read_prefix(fh) -> tuple[str, int]:
+    magic, fingerprint, header_len = _HEADER.unpack(fh.read(_HEADER.size))
+    if magic != COMPILED_PACK_MAGIC:
+        raise ValueError("Not a compiled OpenSolids data pack")
+    return fingerprint.rstrip(b"\x00").decode(), header_len
+
+
+def compiled_pack_is_fresh(base: Path | PackReader, path: Path | None = None) -> bool:
+    reader = _as_reader(base)
+    if path is None:
+        if not reader.exists(COMPILED_PACK_FILENAME):
+            return False
+        path = reader.local_path(COMPILED_PACK_FILENAME)
+    elif not path.exists():
+        return False
+    try:
+        if path is None:
+            prefix = reader.read_bytes(COMPILED_PACK_FILENAME)[: _HEADER.size]
+            stored, _ = _read_prefix(io.BytesIO(prefix))
+        else:
+            with path.open("rb") as fh:
+                stored, _ = _read_prefix(fh)
+    except (ValueError, struct.error):
+        return False
+    fingerprint = pack_fingerprint(reader)
+    # With no JSON sources left (compiled-only deployment) there is nothing to compare.
+    return fingerprint is None or stored == fingerprint
+
+
+def _attach_arrays(model: dict[str, Any], data: np.ndarray) -> dict:
+    out: dict[str, Any] = {}
+    for key, value in model.items():
+        if isinstance(value, dict) and _ARRAY_REF in value:
+            start, count = value[_ARRAY_REF]
+            out[key] = data[start : start + count]
+        elif key == "branches":
+            out[key] = [
+                {**branch, "model": _attach_arrays(branch["model"], data)} for branch in value
+            ]
+        else:
+            out[key] = value
+    return out
+
+
+def decode_pack(buffer) -> tuple[list[dict], list[dict]]:
+    """Decode a compiled pack held in any buffer (bytes, mmap, shared memory).
+
+    Arrays in the returned records are views into ``buffer``; nothing is copied.
+    """
+    view = memoryview(buffer)
+    _, header_len = _read_prefix(io.BytesIO(view[: _HEADER.size]))
+    header = json.loads(bytes(view[_HEADER.size : _HEADER.size + header_len]))
+    if header.get("format_version") != COMPILED_PACK_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compiled pack version: {header.get('format_version')}")
+    data_start = _HEADER.size + header_len
+    data_start += (-data_start) % _ALIGNMENT
+    if len(view) > data_start:
+        data = np.frombuffer(buffer, dtype="<f8", offset=data_start)
+        # Writable buffers (shared memory) are still shared, so never hand out mutable views.
+        data.flags.writeable = False
+    else:
+        data = np.empty(0, dtype="<f8")
+
+    materials = [
+        {
+            **rec,
+            "properties": {
+                key: {**curve, "model": _attach_arrays(curve["model"], data)}
+                for key, curve in rec["properties"].items()
+            },
+        }
+        for rec in header["materials"]
+    ]
+    return materials, header["sources"]
+
+
+def load_compiled_pack(path: Path | bytes) -> tuple[list[dict], list[dict]]:
+    """Return ``(material_records, source_records)`` with arrays as read-only views.
+
+    A path is memory-mapped; ``bytes`` (a compiled pack read out of an archive) is viewed
+    in place, so either way no array values are copied.
+    """
+    if isinstance(path, bytes):
+        return decode_pack(path)
+    with path.open("rb") as fh:
+        mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    return decode_pack(mapped)
@@ -6,6 +6,8 @@ import shutil
 import subprocess
 from pathlib import Path
 
+from opensolids.providers.base import build_pack_index
+
 from .mapper import make_material_record
 
 
@@ -90,6 +92,7 @@ def import_mil_hdbk_5_pdf(
         "provider": "mil-hdbk-5",
         "version": "0.3.0",
         "record_counts": {"materials": 1, "sources": 1},
+        "materials": build_pack_index(output_dir),
         "license_notes": [
             "Imported from local PDF provided by user.",
             "Record revision/date and distribution statement in provenance.",
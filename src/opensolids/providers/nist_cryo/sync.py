@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import requests
+from opensolids.providers.base import build_pack_index
 
 from .mapper import material_record_from_parsed
 from .parser import parse_material_links, parse_material_page
@@ -12,6 +12,8 @@ INDEX_URL = "https://trc.nist.gov/cryogenics/materials/materialproperties.htm"
 
 
 def sync_nist_cryo(output_dir: Path, *, max_materials: int | None = None, timeout: int = 30) -> dict:
+    import requests
+
     output_dir.mkdir(parents=True, exist_ok=True)
     materials_dir = output_dir / "materials"
     sources_dir = output_dir / "sources"
@@ -61,6 +63,7 @@ def sync_nist_cryo(output_dir: Path, *, max_materials: int | None = None, timeou
         "provider": "nist-cryo",
         "version": "0.3.0",
         "record_counts": {"materials": material_count, "sources": source_count},
+        "materials": build_pack_index(output_dir),
         "license_notes": [
             "NIST attribution required.",
             "NIST fair use/license statement applies.",
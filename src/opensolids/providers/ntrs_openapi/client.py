@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 
 class NTRSRateLimiter:
@@ -27,9 +28,19 @@ class NTRSRateLimiter:
 class NTRSOpenAPIClient:
     def __init__(self, base_url: str = "https://ntrs.nasa.gov/api", session: requests.Session | None = None):
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self._session = session
         self.rate_limiter = NTRSRateLimiter()
 
+    @property
+    def session(self) -> requests.Session:
+        # Created on first request so that providers (and `import opensolids`) never load
+        # the HTTP stack unless something is actually fetched.
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
     def _request(self, method: str, path: str, **kwargs) -> dict[str, Any]:
         self.rate_limiter.acquire()
         res = self.session.request(method, f"{self.base_url}{path}", timeout=30, **kwargs)
@@ -4,6 +4,8 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+from opensolids.providers.base import build_pack_index
+
 from .client import NTRSOpenAPIClient
 from .compliance import is_safe_for_numeric_extraction
 
@@ -53,6 +55,7 @@ def sync_ntrs(
         "provider": "ntrs",
         "version": "0.3.0",
         "record_counts": {"materials": 0, "sources": source_count},
+        "materials": build_pack_index(output_dir),
         "synced_since": since,
         "redistributions_checked": len(
             redistributions.get("results") or redistributions.get("citations") or []
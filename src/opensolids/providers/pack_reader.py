@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import zipfile
+from importlib.resources.abc import Traversable
+from pathlib import Path, PurePosixPath
+from typing import Protocol
+
+
+class PackReader(Protocol):
+    """Read access to a data pack laid out as ``manifest.json``, ``materials/``, ``sources/``."""
+
+    def exists(self, name: str) -> bool:
+        ...
+
+    def read_bytes(self, name: str) -> bytes:
+        ...
+
+    def list_json(self, directory: str) -> list[str]:
+        ...
+
+    def size(self, name: str) -> int:
+        ...
+
+    def signature(self, name: str) -> str:
+        """Cheap token that changes whenever the file's content does."""
+        ...
+
+    def local_path(self, name: str) -> Path | None:
+        ...
+
+
+class DirectoryPackReader:
+    def __init__(self, base: Path):
+        self.base = base
+
+    def exists(self, name: str) -> bool:
+        return (self.base / name).exists()
+
+    def read_bytes(self, name: str) -> bytes:
+        return (self.base / name).read_bytes()
+
+    def list_json(self, directory: str) -> list[str]:
+        path = self.base / directory
+        if not path.is_dir():
+            return []
+        return sorted(f"{directory}/{fp.name}" for fp in path.glob("*.json"))
+
+    def size(self, name: str) -> int:
+        return (self.base / name).stat().st_size
+
+    def signature(self, name: str) -> str:
+        stat = (self.base / name).stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def local_path(self, name: str) -> Path | None:
+        return self.base / name
+
+
+class ZipPackReader:
+    """Pack stored in a zip archive (a ``.zip`` pack or a zip-imported wheel/egg).
+
+    The central directory is read once. With ``buffered=True`` the whole archive is pulled
+    in with a single read, so slow network filesystems see one ``open()`` at startup and
+    members are then decompressed from memory as they are requested.
+    """
+
+    def __init__(self, archive: Path, prefix: str | None = None, *, buffered: bool = True):
+        self.archive = archive
+        source = io.BytesIO(archive.read_bytes()) if buffered else archive
+        self._zip = zipfile.ZipFile(source)
+        self._names = set(self._zip.namelist())
+        self.prefix = self._detect_prefix() if prefix is None else prefix.strip("/")
+
+    def _detect_prefix(self) -> str:
+        candidates = [
+            str(PurePosixPath(name).parent)
+            for name in self._names
+            if PurePosixPath(name).name == "manifest.json"
+            or PurePosixPath(name).parent.name in {"materials", "sources"}
+        ]
+        if not candidates:
+            return ""
+        shallowest = min(candidates, key=lambda p: (p.count("/"), p))
+        if PurePosixPath(shallowest).name in {"materials", "sources"}:
+            shallowest = str(PurePosixPath(shallowest).parent)
+        return "" if shallowest == "." else shallowest
+
+    def _member(self, name: str) -> str:
+        return f"{self.prefix}/{name}" if self.prefix else name
+
+    def exists(self, name: str) -> bool:
+        return self._member(name) in self._names
+
+    def read_bytes(self, name: str) -> bytes:
+        return self._zip.read(self._member(name))
+
+    def list_json(self, directory: str) -> list[str]:
+        member_dir = self._member(directory) + "/"
+        strip = len(self.prefix) + 1 if self.prefix else 0
+        return sorted(
+            name[strip:]
+            for name in self._names
+            if name.startswith(member_dir)
+            and name.endswith(".json")
+            and "/" not in name[len(member_dir) :]
+        )
+
+    def size(self, name: str) -> int:
+        return self._zip.getinfo(self._member(name)).file_size
+
+    def signature(self, name: str) -> str:
+        # Size and CRC come from the central directory; no member is decompressed.
+        info = self._zip.getinfo(self._member(name))
+        return f"{info.file_size}:{info.CRC:08x}"
+
+    def local_path(self, name: str) -> Path | None:
+        return None
+
+
+class TraversablePackReader:
+    """Pack exposed through ``importlib.resources`` (for example a non-filesystem loader)."""
+
+    def __init__(self, root: Traversable):
+        self.root = root
+
+    def _resolve(self, name: str) -> Traversable:
+        node = self.root
+        for part in name.split("/"):
+            node = node.joinpath(part)
+        return node
+
+    def exists(self, name: str) -> bool:
+        node = self._resolve(name)
+        return node.is_file() or node.is_dir()
+
+    def read_bytes(self, name: str) -> bytes:
+        return self._resolve(name).read_bytes()
+
+    def list_json(self, directory: str) -> list[str]:
+        node = self._resolve(directory)
+        if not node.is_dir():
+            return []
+        return sorted(
+            f"{directory}/{child.name}"
+            for child in node.iterdir()
+            if child.is_file() and child.name.endswith(".json")
+        )
+
+    def size(self, name: str) -> int:
+        return len(self.read_bytes(name))
+
+    def signature(self, name: str) -> str:
+        # Traversables expose no stat data, so fall back to hashing the content.
+        return hashlib.sha256(self.read_bytes(name)).hexdigest()
+
+    def local_path(self, name: str) -> Path | None:
+        return None
+
+
+def reader_for_path(path: Path) -> PackReader:
+    if path.is_file() and zipfile.is_zipfile(path):
+        return ZipPackReader(path)
+    return DirectoryPackReader(path)
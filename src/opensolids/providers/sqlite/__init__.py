@@ -0,0 +1,4 @@
+from .importer import import_json_packs
+from .provider import SQLiteProvider
+
+__all__ = ["SQLiteProvider", "import_json_packs"]
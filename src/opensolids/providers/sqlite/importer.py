@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+from opensolids.search import normalize_text
+from opensolids.validation import validate_material_record
+
+from .schema import create_schema, split_model_arrays
+
+
+def _delete_material(conn: sqlite3.Connection, material_id: str, has_fts: bool) -> None:
+    for table in ("curve_arrays", "curves", "aliases"):
+        conn.execute(f"DELETE FROM {table} WHERE material_id = ?", (material_id,))
+    conn.execute("DELETE FROM materials WHERE id = ?", (material_id,))
+    if has_fts:
+        conn.execute("DELETE FROM material_search WHERE material_id = ?", (material_id,))
+
+
+def insert_material(conn: sqlite3.Connection, rec: dict, *, has_fts: bool) -> None:
+    validate_material_record(rec)
+    material_id = rec["id"]
+    aliases = list(rec.get("aliases", []))
+    search_text = "\n".join(
+        normalize_text(field)
+        for field in (rec.get("name"), material_id, rec.get("condition"), *aliases)
+        if field
+    )
+
+    _delete_material(conn, material_id, has_fts)
+    conn.execute(
+        "INSERT INTO materials(id, name, composition, condition, notes, density_ref, "
+        "sources_json, search_text) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            material_id,
+            rec["name"],
+            rec.get("composition"),
+            rec.get("condition"),
+            rec.get("notes"),
+            float(rec["density_ref"]) if rec.get("density_ref") is not None else None,
+            json.dumps(rec.get("sources", [])),
+            search_text,
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO aliases(material_id, position, alias, normalized) VALUES (?, ?, ?, ?)",
+        [(material_id, i, alias, normalize_text(alias)) for i, alias in enumerate(aliases)],
+    )
+    if has_fts:
+        conn.execute(
+            "INSERT INTO material_search(material_id, search_text) VALUES (?, ?)",
+            (material_id, search_text),
+        )
+
+    for property_key, curve in rec["properties"].items():
+        model, blobs = split_model_arrays(curve["model"])
+        conn.execute(
+            "INSERT INTO curves(material_id, property_key, record_json) VALUES (?, ?, ?)",
+            (material_id, property_key, json.dumps({**curve, "model": model})),
+        )
+        conn.executemany(
+            "INSERT INTO curve_arrays(material_id, property_key, path, data) VALUES (?, ?, ?, ?)",
+            [(material_id, property_key, path, blob) for path, blob in blobs.items()],
+        )
+
+
+def insert_source(conn: sqlite3.Connection, rec: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO sources(source_id, record_json) VALUES (?, ?)",
+        (rec["source_id"], json.dumps(rec)),
+    )
+
+
+def import_json_packs(db_path: Path, pack_dirs: Iterable[Path]) -> dict:
+    """Import JSON data packs (``materials/*.json`` and ``sources/*.json``) into SQLite."""
+    material_count = 0
+    source_count = 0
+
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            has_fts = create_schema(conn)
+            for pack in pack_dirs:
+                for fp in sorted((pack / "sources").glob("*.json")):
+                    payload = json.loads(fp.read_text())
+                    for rec in payload if isinstance(payload, list) else [payload]:
+                        insert_source(conn, rec)
+                        source_count += 1
+                for fp in sorted((pack / "materials").glob("*.json")):
+                    insert_material(conn, json.loads(fp.read_text()), has_fts=has_fts)
+                    material_count += 1
+    finally:
+        conn.close()
+
+    return {
+        "database": str(db_path),
+        "record_counts": {"materials": material_count, "sources": source_count},
+        "fts": has_fts,
+    }
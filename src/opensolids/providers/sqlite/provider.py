@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+from opensolids.material import available_property_keys
+from opensolids.providers.base import source_ref_from_record
+from opensolids.search import normalize_text
+from opensolids.types import MaterialSummary, SourceRef
+
+from .schema import join_model_arrays
+
+_SUMMARY_COLUMNS = """
+    m.id, m.name, m.condition, m.density_ref, m.sources_json, m.search_text,
+    (SELECT json_group_array(alias) FROM
+        (SELECT alias FROM aliases WHERE material_id = m.id ORDER BY position)),
+    (SELECT json_group_array(property_key) FROM curves WHERE material_id = m.id)
+"""
+
+
+# A quoted FTS5 phrase on a trigram index matches substrings (case-insensitively) through
+# the index; LIKE with an ESCAPE clause would fall back to scanning the whole table.
+_FTS_SEARCH_SQL = f"""
+    SELECT {_SUMMARY_COLUMNS} FROM material_search s
+    JOIN materials m ON m.id = s.material_id
+    WHERE s.search_text MATCH ? ORDER BY m.name, m.id
+"""
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class _ThreadConnection:
+    """Holds one thread's connection; closed when the thread's locals are released."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __del__(self) -> None:
+        self.conn.close()
+
+
+class SQLiteProvider:
+    """Provider backed by a SQLite catalog built with ``import_json_packs``.
+
+    Records are queried on demand, so the catalog does not have to fit in memory. Each
+    thread gets its own read-only connection, so lookups from a thread pool never share
+    a cursor. A thread's connection is closed when that thread exits.
+    """
+
+    def __init__(self, path: Path, *, name: str = "sqlite", version: str = "1"):
+        self.name = name
+        self.version = version
+        self.path = Path(path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: weakref.WeakSet[_ThreadConnection] = weakref.WeakSet()
+        meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+        self._has_fts = meta.get("fts") == "1"
+        self._sources: dict[str, SourceRef] | None = None
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnection(
+                sqlite3.connect(
+                    f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+                )
+            )
+            with self._lock:
+                self._connections.add(holder)
+            self._local.holder = holder
+        return holder.conn
+
+    def close(self) -> None:
+        with self._lock:
+            holders = list(self._connections)
+            self._connections = weakref.WeakSet()
+        for holder in holders:
+            holder.conn.close()
+        self._local = threading.local()
+
+    def has_material(self, material_id: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM materials WHERE id = ?", (material_id,)).fetchone()
+        return row is not None
+
+    def get_material_record(self, material_id: str) -> dict:
+        row = self._conn.execute(
+            "SELECT name, composition, condition, notes, density_ref, sources_json "
+            "FROM materials WHERE id = ?",
+            (material_id,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(material_id)
+        name, composition, condition, notes, density_ref, sources_json = row
+
+        aliases = [
+            alias
+            for (alias,) in self._conn.execute(
+                "SELECT alias FROM aliases WHERE material_id = ? ORDER BY position", (material_id,)
+            )
+        ]
+        blobs: dict[str, dict[str, bytes]] = {}
+        for property_key, path, data in self._conn.execute(
+            "SELECT property_key, path, data FROM curve_arrays WHERE material_id = ?",
+            (material_id,),
+        ):
+            blobs.setdefault(property_key, {})[path] = data
+
+        properties: dict[str, dict] = {}
+        for property_key, record_json in self._conn.execute(
+            "SELECT property_key, record_json FROM curves WHERE material_id = ?", (material_id,)
+        ):
+            curve = json.loads(record_json)
+            curve["model"] = join_model_arrays(curve["model"], blobs.get(property_key, {}))
+            properties[property_key] = curve
+
+        record = {
+            "id": material_id,
+            "name": name,
+            "aliases": aliases,
+            "composition": composition,
+            "condition": condition,
+            "notes": notes,
+            "sources": json.loads(sources_json),
+            "properties": properties,
+        }
+        if density_ref is not None:
+            record["density_ref"] = density_ref
+        return record
+
+    def list_material_ids(self) -> list[str]:
+        rows = self._conn.execute("SELECT id FROM materials ORDER BY id")
+        return [material_id for (material_id,) in rows]
+
+    def source_lookup(self) -> dict[str, SourceRef]:
+        sources = self._sources
+        if sources is None:
+            sources = {
+                source_id: source_ref_from_record(json.loads(record_json))
+                for source_id, record_json in self._conn.execute(
+                    "SELECT source_id, record_json FROM sources"
+                )
+            }
+            self._sources = sources
+        return dict(sources)
+
+    def search(self, query: str) -> list[MaterialSummary]:
+        q = normalize_text(query)
+        if not q:
+            rows = self._conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM materials m ORDER BY m.name, m.id"
+            )
+        elif self._has_fts and len(q) >= 3:
+            rows = self._conn.execute(_FTS_SEARCH_SQL, (_fts_phrase(q),))
+        else:
+            rows = self._conn.execute(
+                f"SELECT {_SUMMARY_COLUMNS} FROM materials m "
+                "WHERE instr(m.search_text, ?) > 0 ORDER BY m.name, m.id",
+                (q,),
+            )
+
+        out: list[MaterialSummary] = []
+        for row in rows:
+            material_id, name, condition, density_ref, sources_json, search_text = row[:6]
+            aliases_json, props_json = row[6:]
+            # Trigram matching is case-insensitive; keep matches_query's exact semantics.
+            if q and q not in search_text:
+                continue
+            out.append(
+                MaterialSummary(
+                    id=material_id,
+                    name=name,
+                    provider=self.name,
+                    condition=condition,
+                    aliases=tuple(json.loads(aliases_json)),
+                    source_count=len(json.loads(sources_json)),
+                    property_coverage=tuple(
+                        available_property_keys(json.loads(props_json), density_ref=density_ref)
+                    ),
+                )
+            )
+        return out
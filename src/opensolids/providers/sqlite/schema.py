@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import sqlite3
+
+import numpy as np
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS materials (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    composition TEXT,
+    condition TEXT,
+    notes TEXT,
+    density_ref REAL,
+    sources_json TEXT NOT NULL,
+    search_text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    material_id TEXT NOT NULL REFERENCES materials(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    alias TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    PRIMARY KEY (material_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_aliases_normalized ON aliases(normalized);
+CREATE TABLE IF NOT EXISTS sources (
+    source_id TEXT PRIMARY KEY,
+    record_json TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS curves (
+    material_id TEXT NOT NULL REFERENCES materials(id) ON DELETE CASCADE,
+    property_key TEXT NOT NULL,
+    record_json TEXT NOT NULL,
+    PRIMARY KEY (material_id, property_key)
+);
+CREATE INDEX IF NOT EXISTS idx_curves_property ON curves(property_key);
+CREATE TABLE IF NOT EXISTS curve_arrays (
+    material_id TEXT NOT NULL,
+    property_key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (material_id, property_key, path),
+    FOREIGN KEY (material_id, property_key)
+        REFERENCES curves(material_id, property_key) ON DELETE CASCADE
+);
+"""
+
+# Substring search index; needs SQLite >= 3.34 built with FTS5.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS material_search USING fts5(
+    material_id UNINDEXED,
+    search_text,
+    tokenize = 'trigram'
+);
+"""
+
+
+def create_schema(conn: sqlite3.Connection) -> bool:
+    """Create tables if missing; return whether the trigram search index is available."""
+    conn.executescript(SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+        has_fts = True
+    except sqlite3.OperationalError:
+        has_fts = False
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+        [("schema_version", str(SCHEMA_VERSION)), ("fts", "1" if has_fts else "0")],
+    )
+    return has_fts
+
+
+_ARRAY_KEYS = {"T", "y", "coefficients"}
+_BLOB_REF = "__blob__"
+
+
+def split_model_arrays(model: dict, prefix: str = "") -> tuple[dict, dict[str, bytes]]:
+    out: dict = {}
+    blobs: dict[str, bytes] = {}
+    for key, value in model.items():
+        path = f"{prefix}{key}"
+        if key in _ARRAY_KEYS and isinstance(value, list):
+            blobs[path] = np.asarray(value, dtype="<f8").tobytes()
+            out[key] = {_BLOB_REF: path}
+        elif key == "branches" and isinstance(value, list):
+            branches = []
+            for i, branch in enumerate(value):
+                branch_model, branch_blobs = split_model_arrays(
+                    branch["model"], f"{path}.{i}.model."
+                )
+                branches.append({**branch, "model": branch_model})
+                blobs.update(branch_blobs)
+            out[key] = branches
+        else:
+            out[key] = value
+    return out, blobs
+
+
+def join_model_arrays(model: dict, blobs: dict[str, bytes]) -> dict:
+    out: dict = {}
+    for key, value in model.items():
+        if isinstance(value, dict) and _BLOB_REF in value:
+            out[key] = np.frombuffer(blobs[value[_BLOB_REF]], dtype="<f8")
+        elif key == "branches":
+            out[key] = [
+                {**branch, "model": join_model_arrays(branch["model"], blobs)} for branch in value
+            ]
+        else:
+            out[key] = value
+    return out
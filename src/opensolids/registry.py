@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 from .canonical_catalog import (
@@ -9,10 +13,42 @@ from .canonical_catalog import (
     build_canonical_lookup,
     normalize_lookup_key,
 )
+from .composition import CompositionPlan, CurveRecordView, compile_composition_plan
 from .material import Material
 from .providers.base import Provider
-from .search import matches_query
-from .types import MaterialSummary
+from .search import SummaryIndex
+from .types import MaterialSummary, SourceRef
+
+
+DEFAULT_MATERIAL_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class MaterialCacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(frozen=True)
+class WarmUpTiming:
+    name: str
+    seconds: float
+    materials: int
+    error: str | None = None
+
+
+def _warm_provider(provider: Provider) -> WarmUpTiming:
+    start = time.perf_counter()
+    try:
+        preload = getattr(provider, "preload", None)
+        if preload is not None:
+            preload()
+        count = len(provider.list_material_ids())
+    except Exception as exc:  # reported, so one bad pack does not abort the others
+        return WarmUpTiming(provider.name, time.perf_counter() - start, 0, repr(exc))
+    return WarmUpTiming(provider.name, time.perf_counter() - start, count)
 
 
 @dataclass
@@ -22,9 +58,98 @@ class ProviderRegistry:
         default_factory=lambda: dict(CANONICAL_MATERIALS_BY_ID)
     )
     canonical_lookup: dict[str, str] = field(default_factory=build_canonical_lookup)
+    material_cache_size: int = DEFAULT_MATERIAL_CACHE_SIZE
+    generation: int = field(default=0, init=False)
+    _material_cache: OrderedDict[str, Material] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _cache_hits: int = field(default=0, init=False, repr=False)
+    _cache_misses: int = field(default=0, init=False, repr=False)
+    _canonical_index: SummaryIndex | None = field(default=None, init=False, repr=False)
+    _provider_index: SummaryIndex | None = field(default=None, init=False, repr=False)
+    _provider_summaries: dict[str, list[MaterialSummary]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _id_index: dict[str, str] | None = field(default=None, init=False, repr=False)
+    _plans: dict[str, CompositionPlan] = field(default_factory=dict, init=False, repr=False)
+    # Lock order: _index_lock (summary builds) -> _lock (ids, plans, registration)
+    # -> _cache_lock (material LRU and generation).
+    _index_lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def register(self, provider: Provider) -> None:
-        self.providers[provider.name] = provider
+        with self._index_lock, self._lock:
+            replaced = provider.name in self.providers
+            self.providers[provider.name] = provider
+            if self._id_index is not None:
+                if replaced:
+                    # Earlier providers win ID collisions, so a replacement needs a rebuild.
+                    self._id_index = None
+                else:
+                    self._index_provider_ids(self._id_index, provider)
+            with self._cache_lock:
+                self.generation += 1
+                self._clear_cache()
+            self._plans.clear()
+            # Canonical summaries depend on every provider; provider summaries on their own pack.
+            self._canonical_index = None
+            self._provider_index = None
+            self._provider_summaries.pop(provider.name, None)
+
+    def _clear_cache(self) -> None:
+        self._material_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def clear_cache(self) -> None:
+        with self._cache_lock:
+            self._clear_cache()
+
+    def cache_info(self) -> MaterialCacheInfo:
+        with self._cache_lock:
+            return MaterialCacheInfo(
+                hits=self._cache_hits,
+                misses=self._cache_misses,
+                maxsize=self.material_cache_size,
+                currsize=len(self._material_cache),
+            )
+
+    def warm_up(
+        self, *, max_workers: int | None = None, build_curves: bool = False
+    ) -> list[WarmUpTiming]:
+        """Load and validate every provider concurrently; return one timing per provider.
+
+        With ``build_curves`` the canonical materials are then composed and their curves
+        built, reported as a final ``"canonical"`` entry.
+        """
+        providers = list(self.providers.values())
+        workers = max_workers or max(1, len(providers))
+        with ThreadPoolExecutor(workers, thread_name_prefix="opensolids-warm-up") as pool:
+            report = list(pool.map(_warm_provider, providers))
+
+        if build_curves:
+            start = time.perf_counter()
+            error = None
+            try:
+                for canonical_id in self.canonical_specs:
+                    mat = self.material(canonical_id)
+                    for property_key in mat._properties:
+                        mat.curve(property_key)
+            except Exception as exc:
+                error = repr(exc)
+            report.append(
+                WarmUpTiming(
+                    "canonical", time.perf_counter() - start, len(self.canonical_specs), error
+                )
+            )
+        return report
 
     def list_providers(self) -> list[str]:
         return sorted(self.providers.keys())
@@ -32,15 +157,36 @@ class ProviderRegistry:
     def list_canonical_material_ids(self) -> list[str]:
         return sorted(self.canonical_specs.keys())
 
+    @staticmethod
+    def _index_provider_ids(index: dict[str, str], provider: Provider) -> None:
+        for material_id in provider.list_material_ids():
+            if material_id.split(":", 1)[0] == provider.name:
+                index[material_id] = provider.name
+            else:
+                index.setdefault(material_id, provider.name)
+
+    def material_index(self) -> dict[str, str]:
+        index = self._id_index
+        if index is not None:
+            return index
+        with self._lock:
+            if self._id_index is None:
+                index = {}
+                for provider in self.providers.values():
+                    self._index_provider_ids(index, provider)
+                self._id_index = index
+            return self._id_index
+
     def _resolve_provider(self, material_id: str) -> tuple[Provider, dict]:
-        prefix = material_id.split(":", 1)[0]
-        provider = self.providers.get(prefix)
-        if provider and provider.has_material(material_id):
+        provider_name = self.material_index().get(material_id)
+        if provider_name is not None:
+            provider = self.providers[provider_name]
             return provider, provider.get_material_record(material_id)
 
-        for candidate in self.providers.values():
-            if candidate.has_material(material_id):
-                return candidate, candidate.get_material_record(material_id)
+        # The prefix provider may hold records its manifest does not list yet.
+        provider = self.providers.get(material_id.split(":", 1)[0])
+        if provider and provider.has_material(material_id):
+            return provider, provider.get_material_record(material_id)
 
         raise KeyError(f"Unknown material id: {material_id}")
 
@@ -56,36 +202,30 @@ class ProviderRegistry:
             raise KeyError(f"Unknown material id: {material_id}")
         return canonical_id
 
-    def _compose_canonical_record(self, canonical_id: str) -> tuple[dict, dict]:
-        spec = self.canonical_specs[canonical_id]
-        source_lookup: dict = {}
-        selected_source_ids: list[str] = []
-        properties: dict[str, dict] = {}
-
-        for property_key, source_material_ids in spec.property_sources.items():
-            for rank, source_material_id in enumerate(source_material_ids, start=1):
-                try:
-                    provider, source_record = self._resolve_provider(source_material_id)
-                except KeyError:
-                    continue
-
-                source_curve = source_record.get("properties", {}).get(property_key)
-                if source_curve is None:
-                    continue
+    def composition_plan(self, material_id: str) -> CompositionPlan:
+        canonical_id = self._resolve_canonical_id(material_id)
+        plan = self._plans.get(canonical_id)
+        if plan is not None:
+            return plan
 
-                curve_record = deepcopy(source_curve)
-                metadata = dict(curve_record.get("metadata", {}))
-                metadata["source_provider"] = provider.name
-                metadata["source_material_id"] = source_record["id"]
-                metadata["selection_rank"] = rank
-                curve_record["metadata"] = metadata
-                properties[property_key] = curve_record
+        generation = self.generation
+        plan = compile_composition_plan(self.canonical_specs[canonical_id], self._resolve_provider)
+        with self._lock:
+            # A plan compiled against providers that were since replaced is not cached.
+            if self.generation != generation:
+                return plan
+            return self._plans.setdefault(canonical_id, plan)
 
-                if curve_record.get("source_id"):
-                    selected_source_ids.append(curve_record["source_id"])
+    def _compose_canonical_record(self, canonical_id: str) -> tuple[dict, Mapping[str, SourceRef]]:
+        spec = self.canonical_specs[canonical_id]
+        plan = self.composition_plan(canonical_id)
+        selected_source_ids: list[str] = []
+        properties: dict[str, CurveRecordView] = {}
 
-                source_lookup.update(provider.source_lookup())
-                break
+        for property_key, selection in plan.selections.items():
+            properties[property_key] = selection.view()
+            if selection.curve_record.get("source_id"):
+                selected_source_ids.append(selection.curve_record["source_id"])
 
         record = {
             "id": spec.id,
@@ -99,9 +239,34 @@ class ProviderRegistry:
         }
         if spec.density_ref is not None:
             record["density_ref"] = float(spec.density_ref)
-        return record, source_lookup
+        return record, plan.source_lookup
 
     def material(self, material_id: str) -> Material:
+        with self._cache_lock:
+            cached = self._material_cache.get(material_id)
+            if cached is not None:
+                self._material_cache.move_to_end(material_id)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
+            generation = self.generation
+
+        # Built outside the lock so slow pack loads do not block cache hits on other ids.
+        mat = self._build_material(material_id)
+        if self.material_cache_size <= 0:
+            return mat
+        with self._cache_lock:
+            if self.generation != generation:
+                return mat
+            existing = self._material_cache.get(material_id)
+            if existing is not None:
+                return existing
+            self._material_cache[material_id] = mat
+            while len(self._material_cache) > self.material_cache_size:
+                self._material_cache.popitem(last=False)
+        return mat
+
+    def _build_material(self, material_id: str) -> Material:
         try:
             provider, rec = self._resolve_provider(material_id)
         except KeyError:
@@ -111,35 +276,80 @@ class ProviderRegistry:
 
         return Material.from_record(rec, provider.source_lookup())
 
-    def search(self, query: str, *, include_provider_records: bool = False) -> list[MaterialSummary]:
-        out: list[MaterialSummary] = []
+    def _canonical_summary(self, spec: CanonicalMaterialSpec) -> MaterialSummary:
+        material = self._build_material(spec.id)
+        return MaterialSummary(
+            id=spec.id,
+            name=spec.name,
+            provider="canonical",
+            condition=spec.condition,
+            aliases=tuple(spec.aliases),
+            canonical_id=spec.id,
+            source_count=len(material.sources),
+            property_coverage=tuple(material.available_properties()),
+        )
 
-        for spec in self.canonical_specs.values():
-            if not matches_query(query, spec.name, spec.id, spec.condition, *spec.aliases):
-                continue
-            material = self.material(spec.id)
-            out.append(
-                MaterialSummary(
-                    id=spec.id,
-                    name=spec.name,
-                    provider="canonical",
-                    condition=spec.condition,
-                    aliases=tuple(spec.aliases),
-                    canonical_id=spec.id,
-                    source_count=len(material.sources),
-                    property_coverage=tuple(material.available_properties()),
+    def canonical_summary_index(self) -> SummaryIndex:
+        index = self._canonical_index
+        if index is not None:
+            return index
+        with self._index_lock:
+            if self._canonical_index is None:
+                self._canonical_index = SummaryIndex(
+                    self._canonical_summary(spec) for spec in self.canonical_specs.values()
                 )
-            )
+            return self._canonical_index
+
+    def provider_summary_index(self) -> SummaryIndex:
+        index = self._provider_index
+        if index is not None:
+            return index
+        with self._index_lock:
+            if self._provider_index is None:
+                for name, provider in self.providers.items():
+                    if name not in self._provider_summaries:
+                        self._provider_summaries[name] = provider.search("")
+                self._provider_index = SummaryIndex(
+                    summary
+                    for summaries in self._provider_summaries.values()
+                    for summary in summaries
+                )
+            return self._provider_index
 
+    def search(
+        self,
+        query: str,
+        *,
+        include_provider_records: bool = False,
+        required_properties: Iterable[str] | None = None,
+        fuzzy: bool = False,
+        limit: int | None = None,
+    ) -> list[MaterialSummary]:
+        indexes = [self.canonical_summary_index()]
         if include_provider_records:
-            for provider in self.providers.values():
-                out.extend(provider.search(query))
+            indexes.append(self.provider_summary_index())
 
-        out.sort(key=lambda item: (item.provider != "canonical", item.name, item.id))
-        return out
+        if fuzzy:
+            top_k = 10 if limit is None else limit
+            ranked = [
+                hit
+                for index in indexes
+                for hit in index.ranked_search(
+                    query, limit=top_k, required_properties=required_properties
+                )
+            ]
+            # Stable sort keeps canonical hits ahead of provider records on equal scores.
+            ranked.sort(key=lambda hit: -hit[0])
+            return [summary for _, summary in ranked[:top_k]]
+
+        out: list[MaterialSummary] = []
+        for index in indexes:
+            out.extend(index.search(query, required_properties=required_properties))
+        return out if limit is None else out[:limit]
 
 
 _DEFAULT_REGISTRY: ProviderRegistry | None = None
+_DEFAULT_REGISTRY_LOCK = threading.Lock()
 
 
 def default_registry() -> ProviderRegistry:
@@ -147,6 +357,14 @@ def default_registry() -> ProviderRegistry:
     if _DEFAULT_REGISTRY is not None:
         return _DEFAULT_REGISTRY
 
+    with _DEFAULT_REGISTRY_LOCK:
+        if _DEFAULT_REGISTRY is None:
+            _DEFAULT_REGISTRY = _build_default_registry()
+        return _DEFAULT_REGISTRY
+
+
+def _build_default_registry() -> ProviderRegistry:
+
     from .providers.curated_public.provider import CuratedPublicProvider
     from .providers.mil_hdbk_5.provider import MilHdbk5Provider
     from .providers.nist_cryo.provider import NISTCryoProvider
@@ -157,5 +375,4 @@ def default_registry() -> ProviderRegistry:
     reg.register(NISTCryoProvider())
     reg.register(NTRSOpenAPIProvider())
     reg.register(MilHdbk5Provider())
-    _DEFAULT_REGISTRY = reg
     return reg
@@ -1,5 +1,14 @@
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterable
+
+import numpy as np
+
+from .canonical_catalog import normalize_lookup_key
+from .types import MaterialSummary
+from .units import CANONICAL_UNITS
+
 
 def normalize_text(text: str) -> str:
     return " ".join(text.lower().strip().split())
@@ -13,3 +22,215 @@ def matches_query(query: str, *fields: str | None) -> bool:
         if field and q in normalize_text(field):
             return True
     return False
+
+
+class TextIndex:
+    """Substring index over normalized text fields with ``matches_query`` semantics.
+
+    Queries of at least ``gram_size`` characters intersect n-gram posting lists and only
+    verify the surviving candidates; shorter queries scan the pre-normalized fields.
+    """
+
+    def __init__(self, gram_size: int = 3):
+        self.gram_size = gram_size
+        self._fields: list[tuple[str, ...]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def _grams(self, text: str) -> set[str]:
+        n = self.gram_size
+        return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+    def add(self, *fields: str | None) -> int:
+        doc = len(self._fields)
+        normalized = tuple(normalize_text(field) for field in fields if field)
+        self._fields.append(normalized)
+        grams: set[str] = set()
+        for field in normalized:
+            grams.update(self._grams(field))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(doc)
+        return doc
+
+    def search(self, query: str) -> list[int]:
+        q = normalize_text(query)
+        if not q:
+            return list(range(len(self._fields)))
+
+        if len(q) < self.gram_size:
+            candidates: Iterable[int] = range(len(self._fields))
+        else:
+            postings = sorted(
+                (self._postings.get(gram, ()) for gram in self._grams(q)), key=len
+            )
+            if not postings[0]:
+                return []
+            candidate_set = set(postings[0])
+            for posting in postings[1:]:
+                # Once few candidates remain, verifying them is cheaper than walking long postings.
+                if len(candidate_set) <= 32:
+                    break
+                candidate_set.intersection_update(posting)
+                if not candidate_set:
+                    return []
+            candidates = sorted(candidate_set)
+
+        return [doc for doc in candidates if any(q in field for field in self._fields[doc])]
+
+
+class FuzzyIndex:
+    """Typo-tolerant ranking over lookup keys (ids, names, aliases).
+
+    Keys are normalized with ``normalize_lookup_key`` and compacted (separators dropped, so
+    ``gr-cop42`` and ``grcop 42`` compare equal), then split into boundary-padded n-grams.
+    A query only scores the candidates that share its rarer grams, and only the
+    ``max_candidates`` with the most shared grams, so cost is bounded by the posting sizes
+    rather than the catalog size.
+    """
+
+    def __init__(
+        self,
+        gram_size: int = 3,
+        *,
+        max_candidates: int = 256,
+        max_posting_size: int = 4096,
+    ):
+        self.gram_size = gram_size
+        self.max_candidates = max_candidates
+        self.max_posting_size = max_posting_size
+        self._keys: list[tuple[frozenset[str], ...]] = []
+        self._postings: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def grams(self, text: str) -> frozenset[str]:
+        compact = normalize_lookup_key(text).replace(" ", "")
+        if not compact:
+            return frozenset()
+        padded = f"#{compact}#"
+        n = min(self.gram_size, len(padded))
+        return frozenset(padded[i : i + n] for i in range(len(padded) - n + 1))
+
+    def add(self, *keys: str | None) -> int:
+        doc = len(self._keys)
+        key_grams = tuple(g for g in (self.grams(key) for key in keys if key) if g)
+        self._keys.append(key_grams)
+        for gram in frozenset().union(*key_grams):
+            self._postings.setdefault(gram, []).append(doc)
+        return doc
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        min_score: float = 0.3,
+        allowed: np.ndarray | None = None,
+    ) -> list[tuple[int, float]]:
+        query_grams = self.grams(query)
+        if not query_grams or limit <= 0:
+            return []
+
+        shared: dict[int, int] = {}
+        postings = sorted((self._postings.get(g, ()) for g in query_grams), key=len)
+        for posting in postings:
+            # Very common grams add little signal; skip them once rarer grams found candidates.
+            if shared and len(posting) > self.max_posting_size:
+                break
+            for doc in posting:
+                shared[doc] = shared.get(doc, 0) + 1
+
+        if allowed is not None:
+            shared = {doc: count for doc, count in shared.items() if allowed[doc]}
+        candidates = heapq.nlargest(self.max_candidates, shared, key=shared.__getitem__)
+
+        scored: list[tuple[int, float]] = []
+        for doc in candidates:
+            score = max(
+                2.0 * len(query_grams & key_grams) / (len(query_grams) + len(key_grams))
+                for key_grams in self._keys[doc]
+            )
+            if score >= min_score:
+                scored.append((doc, score))
+        return heapq.nlargest(limit, scored, key=lambda item: (item[1], -item[0]))
+
+
+def summary_sort_key(summary: MaterialSummary) -> tuple[bool, str, str]:
+    return (summary.provider != "canonical", summary.name, summary.id)
+
+
+class SummaryIndex:
+    def __init__(self, summaries: Iterable[MaterialSummary]):
+        self.summaries = sorted(summaries, key=summary_sort_key)
+        self.text_index = TextIndex()
+        for s in self.summaries:
+            self.text_index.add(s.name, s.id, s.condition, *s.aliases)
+
+        # Property coverage as packed bitsets: one bit per property key, 64 keys per word.
+        self.property_bits: dict[str, int] = {key: i for i, key in enumerate(CANONICAL_UNITS)}
+        for summary in self.summaries:
+            for key in summary.property_coverage:
+                self.property_bits.setdefault(key, len(self.property_bits))
+        n_words = (len(self.property_bits) + 63) // 64
+        self.coverage = np.zeros((len(self.summaries), n_words), dtype=np.uint64)
+        for row, summary in enumerate(self.summaries):
+            self.coverage[row] = self.property_mask(summary.property_coverage)
+
+        self._fuzzy_index: FuzzyIndex | None = None
+
+    @property
+    def fuzzy_index(self) -> FuzzyIndex:
+        if self._fuzzy_index is None:
+            index = FuzzyIndex()
+            for s in self.summaries:
+                index.add(s.id, s.name, *s.aliases)
+            self._fuzzy_index = index
+        return self._fuzzy_index
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def property_mask(self, property_keys: Iterable[str]) -> np.ndarray:
+        mask = np.zeros(self.coverage.shape[1], dtype=np.uint64)
+        for key in property_keys:
+            bit = self.property_bits[key]
+            mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+        return mask
+
+    def search(
+        self,
+        query: str,
+        *,
+        required_properties: Iterable[str] | None = None,
+    ) -> list[MaterialSummary]:
+        selected = np.zeros(len(self.summaries), dtype=bool)
+        selected[self.text_index.search(query)] = True
+
+        coverage = self._coverage_selection(required_properties)
+        if coverage is not None:
+            selected &= coverage
+
+        return [self.summaries[i] for i in np.flatnonzero(selected)]
+
+    def ranked_search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        required_properties: Iterable[str] | None = None,
+    ) -> list[tuple[float, MaterialSummary]]:
+        coverage = self._coverage_selection(required_properties)
+        hits = self.fuzzy_index.search(query, limit=limit, allowed=coverage)
+        return [(score, self.summaries[doc]) for doc, score in hits]
+
+    def _coverage_selection(self, required_properties: Iterable[str] | None) -> np.ndarray | None:
+        required = set(required_properties or ())
+        if not required:
+            return None
+        if not required.issubset(self.property_bits):
+            return np.zeros(len(self.summaries), dtype=bool)
+        mask = self.property_mask(required)
+        return np.all((self.coverage & mask) == mask, axis=1)
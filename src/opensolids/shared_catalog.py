@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+from .canonical_catalog import normalize_lookup_key
+from .material import Material
+from .providers.base import source_ref_from_record
+from .providers.compiled_pack import decode_pack, encode_pack
+from .registry import ProviderRegistry, default_registry
+from .types import SourceRef
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+class _AttachedMemory(shared_memory.SharedMemory):
+    def __del__(self) -> None:
+        # Array views into the block may outlive this object at interpreter exit; the
+        # mapping is released with the process instead of raising BufferError here.
+        pass
+
+
+def _attach_shared_memory(name: str, owner_pid: int | None = None) -> shared_memory.SharedMemory:
+    # Only the creating process should unlink the block when it exits.
+    if sys.version_info >= (3, 13):
+        return _AttachedMemory(name=name, track=False)
+    shm = _AttachedMemory(name=name)
+    if os.name != "nt" and owner_pid not in (os.getpid(), os.getppid()):
+        # Before 3.13 attaching registers the block with this process's resource tracker,
+        # which unlinks it when the process exits. The owner and its pool workers (direct
+        # children) share the owner's tracker, where the registration must stay.
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+@dataclass(frozen=True)
+class SharedCatalogHandle:
+    """Picklable reference to a :class:`SharedCatalog`; pass it to worker processes."""
+
+    name: str
+    size: int
+    owner_pid: int | None = None
+
+    def attach(self) -> AttachedCatalog:
+        """Attach in the current process; repeated calls reuse the same mapping."""
+        attached = _ATTACHED.get(self.name)
+        if attached is not None:
+            return attached
+
+        with _ATTACHED_LOCK:
+            attached = _ATTACHED.get(self.name)
+            if attached is None:
+                attached = _ATTACHED[self.name] = AttachedCatalog(self)
+            return attached
+
+
+class AttachedCatalog:
+    """Worker-side view of a shared catalog.
+
+    Curve arrays are read-only views into the shared block, so attaching costs one header
+    parse and materials are built on first lookup without copying any coefficient or
+    tabular data.
+    """
+
+    def __init__(self, handle: SharedCatalogHandle):
+        self.handle = handle
+        self._shm = _attach_shared_memory(handle.name, handle.owner_pid)
+        records, source_records = decode_pack(self._shm.buf[: handle.size])
+        self._records = {rec["id"]: rec for rec in records}
+        self._sources: dict[str, SourceRef] = {
+            rec["source_id"]: source_ref_from_record(rec) for rec in source_records
+        }
+        self._lookup: dict[str, str] = {}
+        for rec in records:
+            for key in (rec["id"], *rec.get("aliases", [])):
+                self._lookup.setdefault(normalize_lookup_key(key), rec["id"])
+        self._materials: dict[str, Material] = {}
+
+    def list_material_ids(self) -> list[str]:
+        return sorted(self._records)
+
+    def material(self, material_id: str) -> Material:
+        mat = self._materials.get(material_id)
+        if mat is not None:
+            return mat
+        resolved = material_id
+        if resolved not in self._records:
+            resolved = self._lookup.get(normalize_lookup_key(material_id), material_id)
+        if resolved not in self._records:
+            raise KeyError(f"Unknown material id: {material_id}")
+        mat = Material.from_record(self._records[resolved], self._sources)
+        return self._materials.setdefault(material_id, mat)
+
+    def close(self) -> None:
+        """Detach; the mapping stays alive while any returned material still uses it."""
+        with _ATTACHED_LOCK:
+            if _ATTACHED.get(self.handle.name) is self:
+                del _ATTACHED[self.handle.name]
+        self._materials.clear()
+        self._records.clear()
+        try:
+            self._shm.close()
+        except BufferError:
+            pass
+
+
+_ATTACHED: dict[str, AttachedCatalog] = {}
+_ATTACHED_LOCK = threading.Lock()
+
+
+class SharedCatalog:
+    """Materials of a registry with every curve array placed in one shared-memory block.
+
+    The block uses the compiled pack layout. Create it once in the parent, hand
+    :attr:`handle` to ``ProcessPoolExecutor`` tasks or initializers, and call
+    ``handle.attach().material(id)`` in workers. Memory stays constant in the number of
+    workers because every worker evaluates against the same pages.
+    """
+
+    def __init__(self, payload: bytes):
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        self._shm.buf[: len(payload)] = payload
+        self.handle = SharedCatalogHandle(self._shm.name, len(payload), os.getpid())
+
+    @classmethod
+    def from_registry(
+        cls,
+        registry: ProviderRegistry | None = None,
+        material_ids: Iterable[str] | None = None,
+    ) -> SharedCatalog:
+        """Share ``material_ids`` (default: every canonical and provider material)."""
+        reg = registry or default_registry()
+        if material_ids is None:
+            material_ids = reg.list_canonical_material_ids()
+            for name in reg.list_providers():
+                material_ids.extend(reg.providers[name].list_material_ids())
+
+        records: list[dict] = []
+        sources: dict[str, SourceRef] = {}
+        for material_id in material_ids:
+            try:
+                provider, record = reg.resolve(material_id)
+                lookup: Mapping[str, SourceRef] = provider.source_lookup()
+            except KeyError:
+                canonical_id = reg._resolve_canonical_id(material_id)
+                record, lookup = reg._compose_canonical_record(canonical_id)
+            record = _plain(record)
+            records.append(record)
+            for curve in record["properties"].values():
+                source_id = curve.get("source_id")
+                if source_id in lookup:
+                    sources[source_id] = lookup[source_id]
+            for source_id in record.get("sources", []):
+                if source_id in lookup:
+                    sources[source_id] = lookup[source_id]
+
+        source_records = [dataclasses.asdict(ref) for ref in sources.values()]
+        return cls(encode_pack(records, source_records))
+
+    def close(self) -> None:
+        attached = _ATTACHED.get(self.handle.name)
+        if attached is not None:
+            attached.close()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedCatalog:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
+
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pint
 
-UREG = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+if TYPE_CHECKING:
+    import pint
+
+_UREG: pint.UnitRegistry | None = None
+_UREG_LOCK = threading.Lock()
 
 
 CANONICAL_UNITS: dict[str, str] = {
@@ -22,6 +28,26 @@ CANONICAL_UNITS: dict[str, str] = {
 }
 
 
+def unit_registry() -> pint.UnitRegistry:
+    """Shared pint registry, built on first use; pint is not imported before that."""
+    global _UREG
+    if _UREG is not None:
+        return _UREG
+
+    with _UREG_LOCK:
+        if _UREG is None:
+            import pint
+
+            _UREG = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+        return _UREG
+
+
+def __getattr__(name: str):
+    if name == "UREG":
+        return unit_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def as_array_with_scalar_flag(value: float | Iterable[float]) -> tuple[np.ndarray, bool]:
     arr = np.asarray(value, dtype=float)
     return (arr.reshape(1), True) if arr.ndim == 0 else (arr, False)
@@ -37,12 +63,48 @@ def convert_values(values, from_units: str, to_units: str | None):
     if to_units is None or to_units == from_units:
         return values
 
+    conversion = _compile_conversion(from_units, to_units)
+    if conversion is None:
+        arr, was_scalar = as_array_with_scalar_flag(values)
+        converted = _quantity(arr, from_units).to(to_units).magnitude
+        return restore_scalar_if_needed(np.asarray(converted, dtype=float), was_scalar)
+
+    scale, offset = conversion
+    if isinstance(values, (float, int)):
+        return float(values) * scale + offset
     arr, was_scalar = as_array_with_scalar_flag(values)
+    converted = arr * scale
+    if offset:
+        converted += offset
+    return restore_scalar_if_needed(converted, was_scalar)
+
+
+def _quantity(magnitude, units: str):
+    if units in {"", "1", "dimensionless"}:
+        return magnitude * unit_registry().dimensionless
+    return magnitude * unit_registry()(units)
+
+
+@lru_cache(maxsize=256)
+def _compile_conversion(from_units: str, to_units: str) -> tuple[float, float] | None:
+    """Reduce a unit conversion to ``(scale, offset)``, or None if it is not affine.
+
+    Pint parses and validates both units here, once per pair; unknown units and
+    dimensionality errors propagate (and are not cached).
+    """
+    offset = float(_quantity(0.0, from_units).to(to_units).magnitude)
+    scale = float(_quantity(1.0, from_units).to(to_units).magnitude) - offset
+    probe = float(_quantity(1000.0, from_units).to(to_units).magnitude)
+    if not np.isclose(probe, 1000.0 * scale + offset, rtol=1e-9):
+        return None
+    return scale, offset
 
-    if from_units in {"", "1", "dimensionless"}:
-        q = arr * UREG.dimensionless
-    else:
-        q = arr * UREG(from_units)
 
-    converted = q.to(to_units).magnitude
-    return restore_scalar_if_needed(np.asarray(converted, dtype=float), was_scalar)
+def affine_conversion(from_units: str, to_units: str) -> tuple[float, float]:
+    """``(scale, offset)`` with ``to = scale * from + offset`` for a unit conversion."""
+    if to_units == from_units:
+        return 1.0, 0.0
+    conversion = _compile_conversion(from_units, to_units)
+    if conversion is None:
+        raise ValueError(f"Conversion from {from_units} to {to_units} is not affine")
+    return conversion
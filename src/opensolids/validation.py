@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from importlib import metadata
+from pathlib import Path
 from typing import Any
 
-from .units import CANONICAL_UNITS, UREG
+from .units import CANONICAL_UNITS, unit_registry
+
+VALIDATION_CACHE_VERSION = 1
 
 REQUIRED_MATERIAL_FIELDS = {
     "id",
@@ -23,7 +31,7 @@ REQUIRED_CURVE_FIELDS = {
 def _validate_units(units: str) -> None:
     if units in {"", "1", "dimensionless"}:
         return
-    UREG(units)
+    unit_registry()(units)
 
 
 def validate_curve_record(curve: dict[str, Any], *, property_key: str | None = None) -> None:
@@ -42,7 +50,7 @@ def validate_curve_record(curve: dict[str, Any], *, property_key: str | None = N
                     f"Invalid units for dimensionless property '{property_key}': {units}"
                 )
         else:
-            (1 * UREG(units)).to(canonical_units)
+            (1 * unit_registry()(units)).to(canonical_units)
 
     tmin = float(curve["valid_T_min"])
     tmax = float(curve["valid_T_max"])
@@ -73,3 +81,83 @@ def validate_material_record(record: dict[str, Any]) -> None:
         if not isinstance(curve, dict):
             raise ValueError(f"Curve record for {prop_key} must be a dict")
         validate_curve_record(curve, property_key=prop_key)
+
+
+
+def _library_version() -> str:
+    try:
+        return metadata.version("opensolids")
+    except metadata.PackageNotFoundError:
+        return "0+unknown"
+
+
+def validator_fingerprint() -> str:
+    """Short digest of the validation rules: this module's source and the canonical units.
+
+    Markers are keyed on it rather than the distribution version, which stays constant
+    (``0+unknown``) in a source checkout while the validator changes.
+    """
+    digest = hashlib.sha256()
+    try:
+        digest.update(Path(__file__).read_bytes())
+    except OSError:
+        digest.update(_library_version().encode())
+    digest.update(json.dumps(CANONICAL_UNITS, sort_keys=True).encode())
+    return digest.hexdigest()[:16]
+
+
+def default_cache_dir() -> Path:
+    override = os.environ.get("OPENSOLIDS_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "opensolids"
+
+
+class ValidationCache:
+    """Persistent record of material files that already passed ``validate_material_record``.
+
+    Entries are marker files named by the SHA-256 of the file content, grouped under
+    :func:`validator_fingerprint`, so any edit to a record or to the rules revalidates. Strict mode (or
+    ``OPENSOLIDS_STRICT_VALIDATION=1``) always runs full validation.
+    """
+
+    def __init__(self, directory: Path | None = None, *, strict: bool | None = None):
+        if strict is None:
+            strict = os.environ.get("OPENSOLIDS_STRICT_VALIDATION", "") not in {"", "0"}
+        self.strict = strict
+        self.directory = (directory or default_cache_dir()) / (
+            f"validated-v{VALIDATION_CACHE_VERSION}-{validator_fingerprint()}"
+        )
+
+    def _marker(self, payload: bytes) -> Path:
+        return self.directory / hashlib.sha256(payload).hexdigest()
+
+    def validate(self, payload: bytes, record: dict[str, Any]) -> None:
+        if self.strict:
+            validate_material_record(record)
+            return
+
+        marker = self._marker(payload)
+        if marker.exists():
+            return
+
+        validate_material_record(record)
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
+
+
+_DEFAULT_VALIDATION_CACHE: ValidationCache | None = None
+_DEFAULT_VALIDATION_CACHE_LOCK = threading.Lock()
+
+
+def default_validation_cache() -> ValidationCache:
+    global _DEFAULT_VALIDATION_CACHE
+    if _DEFAULT_VALIDATION_CACHE is None:
+        with _DEFAULT_VALIDATION_CACHE_LOCK:
+            if _DEFAULT_VALIDATION_CACHE is None:
+                _DEFAULT_VALIDATION_CACHE = ValidationCache()
+    return _DEFAULT_VALIDATION_CACHE
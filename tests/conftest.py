@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+from opensolids import validation
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    """Keep validation markers out of the real ``~/.cache/opensolids``."""
+    previous = os.environ.get("OPENSOLIDS_CACHE_DIR")
+    os.environ["OPENSOLIDS_CACHE_DIR"] = str(tmp_path_factory.mktemp("opensolids-cache"))
+    validation._DEFAULT_VALIDATION_CACHE = None
+    yield
+    validation._DEFAULT_VALIDATION_CACHE = None
+    if previous is None:
+        os.environ.pop("OPENSOLIDS_CACHE_DIR", None)
+    else:
+        os.environ["OPENSOLIDS_CACHE_DIR"] = previous
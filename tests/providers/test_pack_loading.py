@@ -0,0 +1,216 @@
+import json
+import shutil
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from opensolids.cli.main import main
+from opensolids.material import Material
+from opensolids.providers import base as base_module
+from opensolids.providers.base import LocalDataPackProvider
+from opensolids.providers.compiled_pack import (
+    COMPILED_PACK_FILENAME,
+    compile_pack,
+    compiled_pack_is_fresh,
+    load_compiled_pack,
+)
+from opensolids.providers.pack_reader import DirectoryPackReader, ZipPackReader
+
+NIST_PACK = Path("packages/opensolids_data_nist_cryo/src/opensolids_data_nist_cryo")
+
+
+def _provider(base: Path) -> LocalDataPackProvider:
+    return LocalDataPackProvider(
+        name="nist-cryo",
+        version="test",
+        package_name="opensolids_data_missing_test_pack",
+        fallback_path=base,
+    )
+
+
+def test_compiled_pack_round_trips_records_with_mapped_arrays(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    summary = compile_pack(pack)
+    assert summary["materials"] == 7
+
+    materials, sources = load_compiled_pack(pack / COMPILED_PACK_FILENAME)
+    assert len(sources) == 7
+
+    by_id = {rec["id"]: rec for rec in materials}
+    original = json.loads((pack / "materials" / "nist_304.json").read_text())
+    coefficients = by_id[original["id"]]["properties"]["k"]["model"]["coefficients"]
+    assert isinstance(coefficients, np.ndarray)
+    assert not coefficients.flags.owndata
+    assert not coefficients.flags.writeable
+    np.testing.assert_array_equal(coefficients, original["properties"]["k"]["model"]["coefficients"])
+
+
+def test_provider_prefers_fresh_compiled_pack(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    compile_pack(pack)
+
+    provider = _provider(pack)
+    record = provider.get_material_record("nist-cryo:aluminum-6061-t6")
+    assert isinstance(record["properties"]["k"]["model"]["coefficients"], np.ndarray)
+
+    mat = Material.from_record(record, provider.source_lookup())
+    reference = _provider(NIST_PACK)
+    expected = Material.from_record(
+        reference.get_material_record("nist-cryo:aluminum-6061-t6"), reference.source_lookup()
+    )
+    assert mat.k(293.15) == expected.k(293.15)
+    np.testing.assert_allclose(mat.eps_th([50.0, 200.0]), expected.eps_th([50.0, 200.0]))
+
+
+def test_fresh_compiled_pack_cold_start_reads_no_json(tmp_path, monkeypatch):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    compile_pack(pack)
+
+    reads: list[str] = []
+    checks: list[object] = []
+    original_read = DirectoryPackReader.read_bytes
+    monkeypatch.setattr(
+        DirectoryPackReader,
+        "read_bytes",
+        lambda self, name: reads.append(name) or original_read(self, name),
+    )
+    monkeypatch.setattr(
+        base_module,
+        "compiled_pack_is_fresh",
+        lambda reader: checks.append(reader) or compiled_pack_is_fresh(reader),
+    )
+
+    provider = _provider(pack)
+    assert provider.has_material("nist-cryo:inconel-718")
+    assert provider.get_material_record("nist-cryo:inconel-718")["name"]
+    assert reads == []
+    assert len(checks) == 1
+
+
+def test_stale_compiled_pack_falls_back_to_json(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    compile_pack(pack)
+    assert compiled_pack_is_fresh(pack)
+
+    fp = pack / "materials" / "nist_304.json"
+    rec = json.loads(fp.read_text())
+    rec["name"] = "Stainless Steel 304 (edited)"
+    fp.write_text(json.dumps(rec))
+    assert not compiled_pack_is_fresh(pack)
+
+    provider = _provider(pack)
+    assert provider.get_material_record(rec["id"])["name"] == "Stainless Steel 304 (edited)"
+
+
+def test_compiled_only_pack_loads_without_json(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    assert main(["compile", "--pack", str(pack)]) == 0
+    shutil.rmtree(pack / "materials")
+    shutil.rmtree(pack / "sources")
+
+    provider = _provider(pack)
+    assert "nist-cryo:inconel-718" in provider.list_material_ids()
+    assert provider.source_lookup()
+
+
+def test_manifest_index_answers_lookups_and_search_without_reading_materials(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    provider = _provider(pack)
+
+    assert provider.has_material("nist-cryo:inconel-718")
+    assert "nist-cryo:stainless-steel-316" in provider.list_material_ids()
+    hits = {hit.id: hit for hit in provider.search("copper")}
+    assert "alpha" in hits["nist-cryo:oxygen-free-copper"].property_coverage
+    assert provider._materials == {}
+
+    record = provider.get_material_record("nist-cryo:inconel-718")
+    assert record["name"]
+    assert set(provider._materials) == {"nist-cryo:inconel-718"}
+    assert not provider._loaded
+
+
+def test_stale_manifest_index_falls_back_to_full_load(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    rec = json.loads((pack / "materials" / "nist_304.json").read_text())
+    rec["id"] = "nist-cryo:stainless-steel-304-copy"
+    (pack / "materials" / "nist_304_copy.json").write_text(json.dumps(rec))
+
+    provider = _provider(pack)
+    assert provider.has_material("nist-cryo:stainless-steel-304-copy")
+    assert provider._loaded
+
+
+def test_manifest_index_detects_records_edited_in_place(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    fp = pack / "materials" / "nist_304.json"
+    rec = json.loads(fp.read_text())
+    rec["aliases"] = [*rec["aliases"], "Edited Alias 304"]
+    fp.write_text(json.dumps(rec, indent=2) + "\n")
+
+    provider = _provider(pack)
+    assert [hit.id for hit in provider.search("edited alias 304")] == [rec["id"]]
+    assert provider._loaded
+
+
+def _zip_pack(source: Path, archive: Path, prefix: str = "") -> Path:
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for fp in sorted(source.rglob("*")):
+            if fp.is_file() and "__pycache__" not in fp.parts:
+                zf.write(fp, f"{prefix}{fp.relative_to(source).as_posix()}")
+    return archive
+
+
+def test_zip_archive_pack_loads_through_fallback_path(tmp_path):
+    archive = _zip_pack(NIST_PACK, tmp_path / "nist.zip", prefix="nist_cryo/")
+    provider = _provider(archive)
+
+    assert "nist-cryo:inconel-718" in provider.list_material_ids()
+    assert "nist-cryo:oxygen-free-copper" in {hit.id for hit in provider.search("copper")}
+    mat = Material.from_record(
+        provider.get_material_record("nist-cryo:inconel-718"), provider.source_lookup()
+    )
+    reference = _provider(NIST_PACK)
+    expected = Material.from_record(
+        reference.get_material_record("nist-cryo:inconel-718"), reference.source_lookup()
+    )
+    assert mat.k(77.0) == expected.k(77.0)
+
+
+def test_compiled_pack_inside_zip_is_viewed_without_json(tmp_path):
+    pack = tmp_path / "pack"
+    shutil.copytree(NIST_PACK, pack)
+    compile_pack(pack)
+    shutil.rmtree(pack / "materials")
+    shutil.rmtree(pack / "sources")
+    provider = _provider(_zip_pack(pack, tmp_path / "compiled.zip"))
+
+    record = provider.get_material_record("nist-cryo:aluminum-6061-t6")
+    coefficients = record["properties"]["k"]["model"]["coefficients"]
+    assert isinstance(coefficients, np.ndarray)
+    assert not coefficients.flags.writeable
+    assert provider.source_lookup()
+
+
+def test_zip_imported_package_reads_pack_from_archive(tmp_path, monkeypatch):
+    archive = _zip_pack(NIST_PACK, tmp_path / "wheel.zip", prefix="opensolids_data_zip_test_pack/")
+    monkeypatch.syspath_prepend(str(archive))
+    provider = LocalDataPackProvider(
+        name="nist-cryo",
+        version="test",
+        package_name="opensolids_data_zip_test_pack",
+        fallback_path=tmp_path / "missing",
+    )
+
+    assert isinstance(provider._pack_reader(), ZipPackReader)
+    assert provider.has_material("nist-cryo:stainless-steel-316")
+    assert provider.get_material_record("nist-cryo:stainless-steel-316")["name"]
+    assert provider._materials.keys() == {"nist-cryo:stainless-steel-316"}
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opensolids.providers import NISTCryoProvider, SQLiteProvider
+from opensolids.providers.sqlite import import_json_packs
+from opensolids.registry import ProviderRegistry
+
+PACKS = [
+    Path("packages/opensolids_data_nist_cryo/src/opensolids_data_nist_cryo"),
+    Path("packages/opensolids_data_curated_public/src/opensolids_data_curated_public"),
+]
+
+
+@pytest.fixture()
+def provider(tmp_path):
+    db = tmp_path / "catalog.sqlite"
+    summary = import_json_packs(db, PACKS)
+    assert summary["record_counts"]["materials"] == 14
+    provider = SQLiteProvider(db, name="catalog")
+    yield provider
+    provider.close()
+
+
+def test_sqlite_provider_round_trips_records(provider):
+    reference = NISTCryoProvider().get_material_record("nist-cryo:stainless-steel-316")
+    record = provider.get_material_record("nist-cryo:stainless-steel-316")
+
+    assert record["name"] == reference["name"]
+    assert record["aliases"] == reference["aliases"]
+    assert set(record["properties"]) == set(reference["properties"])
+    np.testing.assert_array_equal(
+        record["properties"]["k"]["model"]["coefficients"],
+        reference["properties"]["k"]["model"]["coefficients"],
+    )
+    assert provider.has_material("curated-public:c110-room-temp")
+    assert not provider.has_material("nist-cryo:unobtainium")
+    with pytest.raises(KeyError):
+        provider.get_material_record("nist-cryo:unobtainium")
+    assert "nist-cryo-src:stainless-steel-316" in provider.source_lookup()
+
+
+def test_sqlite_provider_search_matches_pack_provider(provider):
+    for query in ("", "copper", "316", "Stainless Steel", "t6", "zz"):
+        expected = {hit.id for hit in NISTCryoProvider().search(query)}
+        found = {hit.id for hit in provider.search(query) if hit.id.startswith("nist-cryo:")}
+        assert found == expected, query
+
+    hit = {h.id: h for h in provider.search("oxygen")}["nist-cryo:oxygen-free-copper"]
+    assert hit.provider == "catalog"
+    assert "alpha" in hit.property_coverage
+
+
+def test_sqlite_provider_serves_registry_materials(provider):
+    reg = ProviderRegistry()
+    reg.register(provider)
+    mat = reg.material("nist-cryo:aluminum-6061-t6")
+    assert 130.0 < mat.k(293.15) < 180.0
+    assert mat.sources
+
+
+def test_sqlite_provider_substring_search_uses_trigram_index(provider):
+    from opensolids.providers.sqlite.provider import _FTS_SEARCH_SQL
+
+    if not provider._has_fts:
+        pytest.skip("SQLite built without FTS5 trigram support")
+    plan = provider._conn.execute(f"EXPLAIN QUERY PLAN {_FTS_SEARCH_SQL}", ('"copper"',)).fetchall()
+    details = " ".join(row[-1] for row in plan)
+    assert "VIRTUAL TABLE INDEX 0:M" in details
+
+    assert provider.search('50%_"x') == []
+    assert "nist-cryo:oxygen-free-copper" in {hit.id for hit in provider.search("free-cop")}
+
+
+def test_sqlite_provider_closes_connections_of_exited_threads(provider):
+    import sqlite3
+    import threading
+
+    opened = []
+
+    def worker():
+        assert provider.has_material("nist-cryo:inconel-718")
+        opened.append(provider._conn)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(provider._connections) == 1
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -135,3 +135,33 @@ def test_alsi10mg_am_has_complete_core_properties():
     assert {"k", "cp", "rho", "diffusivity", "E", "sigma_y", "sigma_uts"}.issubset(props)
     assert 100.0 < mat.k(293.15) < 200.0
     assert 500.0 < mat.cp(293.15) < 1100.0
+
+
+def test_composition_plan_exposes_selected_sources():
+    from opensolids.registry import default_registry
+
+    plan = default_registry().composition_plan("c110")
+    assert plan.canonical_id == "c110"
+    assert plan.selections["k"].material_id == "nist-cryo:oxygen-free-copper-rrr50"
+    assert plan.selections["k"].rank == 1
+    assert plan.selections["rho"].provider == "curated-public"
+    assert plan.unresolved == ()
+    assert plan.describe()["sigma_y"]["material_id"] == "curated-public:c110-room-temp"
+    assert default_registry().composition_plan("etp copper") is plan
+
+
+def test_canonical_curves_share_provider_records_without_copying():
+    from opensolids.registry import default_registry
+
+    reg = default_registry()
+    provider_record = reg.resolve("nist-cryo:oxygen-free-copper")[1]
+    view = reg.material("c101")._properties["cp"]
+
+    assert view._base is provider_record["properties"]["cp"]
+    with pytest.raises(TypeError):
+        view["units"] = "J/(g*K)"
+
+    metadata = osl.material("c101").curve("cp").metadata
+    assert metadata["source_material_id"] == "nist-cryo:oxygen-free-copper"
+    assert metadata["selection_rank"] == 1
+    assert "source_provider" not in provider_record["properties"]["cp"].get("metadata", {})
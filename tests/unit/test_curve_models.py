@@ -1,7 +1,17 @@
+import math
+
 import numpy as np
 import pytest
 
 from opensolids.curve import curve_from_record
+from opensolids.models import (
+    BranchCondition,
+    LogPolynomialModel,
+    PiecewiseBranch,
+    PiecewiseModel,
+    PolynomialModel,
+    TabularModel,
+)
 
 
 SOURCE_LOOKUP = {}
@@ -33,6 +43,24 @@ def test_log_polynomial_evaluation():
     assert curve(10.0) == pytest.approx(10.0)
 
 
+def test_horner_kernels_match_power_series_and_fill_out_buffers():
+    coefficients = [-1.4087, 1.3982, 0.2543, -0.6260, 0.2334, 0.4256, -0.4658, 0.1650, -0.0199]
+    T = np.linspace(4.0, 300.0, 257)
+    logT = np.log10(T)
+    series = sum(c * logT**i for i, c in enumerate(coefficients))
+
+    out = np.empty_like(T)
+    result = LogPolynomialModel(coefficients).evaluate(T, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, 10.0**series, rtol=1e-12)
+
+    poly = PolynomialModel(coefficients).evaluate(logT)
+    np.testing.assert_allclose(poly, series, rtol=1e-12, atol=1e-14)
+
+    with pytest.raises(ValueError):
+        LogPolynomialModel(coefficients).evaluate(np.array([10.0, 0.0]))
+
+
 def test_piecewise_evaluation():
     rec = {
         "units": "W/(m*K)",
@@ -57,6 +85,118 @@ def test_piecewise_evaluation():
     np.testing.assert_allclose(values, np.array([1.0, 2.0, 2.0]))
 
 
+def _first_match(branches, T):
+    out = np.full_like(T, np.nan)
+    assigned = np.zeros_like(T, dtype=bool)
+    for branch in branches:
+        mask = branch.condition.mask(T) & ~assigned
+        out[mask] = branch.model.evaluate(T[mask])
+        assigned |= mask
+    return out, assigned
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        [("lt", None, 5.0), ("ge", 5.0, None)],
+        [("le", None, 5.0), ("gt", 5.0, None)],
+        [("between", 2.0, 4.0), ("lt", None, 3.0), ("gt", 3.5, None), ("default", None, None)],
+        [("ge", 1.0, None), ("lt", None, 6.0)],
+        [("between", 3.0, 3.0), ("default", None, None)],
+    ],
+)
+def test_piecewise_breakpoints_match_first_matching_branch(conditions):
+    branches = [
+        PiecewiseBranch(BranchCondition(kind, lower, upper), PolynomialModel([float(i), 1.0]))
+        for i, (kind, lower, upper) in enumerate(conditions)
+    ]
+    model = PiecewiseModel(branches)
+    assert (model.owners >= 0).all()
+
+    T = np.concatenate([np.linspace(-2.0, 10.0, 97), [2.0, 3.0, 3.5, 4.0, 5.0, 6.0]])
+    expected, _ = _first_match(branches, T)
+    np.testing.assert_array_equal(model.evaluate(T), expected)
+    np.testing.assert_array_equal(model.evaluate(np.sort(T)), _first_match(branches, np.sort(T))[0])
+
+
+def test_piecewise_gaps_raise_only_when_hit():
+    model = PiecewiseModel(
+        [
+            PiecewiseBranch(BranchCondition("lt", upper=2.0), PolynomialModel([1.0])),
+            PiecewiseBranch(BranchCondition("ge", lower=4.0), PolynomialModel([2.0])),
+        ]
+    )
+    assert (model.owners < 0).any()
+    np.testing.assert_array_equal(model.evaluate(np.array([1.0, 4.0, 5.0])), [1.0, 2.0, 2.0])
+    with pytest.raises(ValueError):
+        model.evaluate(np.array([1.0, 3.0]))
+    with pytest.raises(ValueError):
+        model.evaluate(np.array([5.0, np.nan]))
+
+
+def test_tabular_linear_extrapolates_end_segments():
+    model = TabularModel([0.0, 1.0, 2.0], [0.0, 1.0, 4.0])
+    np.testing.assert_allclose(
+        model.evaluate(np.array([-1.0, 0.5, 1.5, 3.0])), [-1.0, 0.5, 2.5, 7.0]
+    )
+
+
+def test_tabular_linear_extrapolates_around_nan():
+    model = TabularModel([0.0, 1.0, 2.0], [0.0, 1.0, 4.0])
+    T = np.array([-1.0, np.nan, 3.0])
+
+    np.testing.assert_array_equal(model.evaluate(T), [-1.0, np.nan, 7.0])
+    assert [model.evaluate_scalar(t) for t in (-1.0, 3.0)] == [-1.0, 7.0]
+    assert math.isnan(model.evaluate_scalar(math.nan))
+
+
+def test_tabular_pchip_is_shape_preserving():
+    T = np.array([10.0, 20.0, 40.0, 80.0, 160.0])
+    y = np.array([1.0, 3.0, 3.5, 9.0, 9.2])
+    model = TabularModel(T, y, interpolation="pchip")
+
+    np.testing.assert_allclose(model.evaluate(T), y)
+    sweep = model.evaluate(np.linspace(10.0, 160.0, 5001))
+    assert np.all(np.diff(sweep) >= 0.0)
+    linear = TabularModel([0.0, 1.0, 3.0], [1.0, 3.0, 7.0], interpolation="pchip")
+    np.testing.assert_allclose(linear.evaluate(np.array([-1.0, 2.0, 4.0])), [-1.0, 5.0, 9.0])
+
+
+def test_tabular_pchip_matches_reference_values():
+    # Produced once with scipy.interpolate.PchipInterpolator(T, y, extrapolate=True).
+    T = np.array([10.0, 20.0, 40.0, 80.0, 160.0])
+    y = np.array([1.0, 3.0, 3.5, 9.0, -2.0])
+    x = np.array([0.0, 12.5, 20.0, 33.0, 55.0, 79.0, 120.0, 170.0])
+    expected = [
+        -0.30630630630630673,
+        1.652977195945946,
+        3.0,
+        3.3204104729729735,
+        5.470424107142858,
+        8.990816964285715,
+        6.708333333333333,
+        -5.501953125000002,
+    ]
+    model = TabularModel(T, y, "pchip")
+
+    np.testing.assert_allclose(model.evaluate(x), expected, rtol=1e-13)
+    np.testing.assert_allclose([model.evaluate_scalar(t) for t in x], expected, rtol=1e-13)
+
+
+def test_tabular_pchip_matches_scipy():
+    interpolate = pytest.importorskip("scipy.interpolate")
+    rng = np.random.default_rng(7)
+    for n in (2, 3, 5, 12):
+        T = np.cumsum(rng.uniform(0.5, 20.0, n))
+        y = rng.normal(size=n)
+        x = np.concatenate([np.linspace(T[0] - 5.0, T[-1] + 5.0, 5000), T])
+        expected = interpolate.PchipInterpolator(T, y, extrapolate=True)(x)
+        model = TabularModel(T, y, "pchip")
+        np.testing.assert_allclose(model.evaluate(x), expected, atol=1e-12)
+        order = np.argsort(x)
+        np.testing.assert_allclose(model.evaluate(x[order]), expected[order], atol=1e-12)
+
+
 def test_out_of_range_policies():
     rec = {
         "units": "Pa",
@@ -217,3 +217,11 @@ def test_canonical_sigma_y_curves_include_condition_metadata():
         assert not missing, (
             f"{material_id}.sigma_y metadata missing keys: {sorted(missing)}"
         )
+
+
+def test_pack_manifests_index_every_material():
+    from opensolids.providers.base import build_pack_index
+
+    for fp in sorted(Path("packages").glob("*/src/*/manifest.json")):
+        manifest = json.loads(fp.read_text())
+        assert manifest["materials"] == build_pack_index(fp.parent), fp
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import opensolids
+
+SRC_DIR = Path(opensolids.__file__).resolve().parents[1]
+HEAVY_MODULES = ("pint", "scipy", "requests")
+
+_PROBE = """
+import json, sys
+import {module}
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+def _heavy_modules_after_import(module: str) -> list[str]:
+    pythonpath = os.pathsep.join([str(SRC_DIR), os.environ.get("PYTHONPATH", "")])
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return json.loads(out.stdout)
+
+
+@pytest.mark.parametrize("module", ["opensolids", "opensolids.cli.main"])
+def test_import_defers_heavy_dependencies(module):
+    # Deferred imports are what keep startup fast; wall time is too noisy to assert on.
+    assert _heavy_modules_after_import(module) == []
+
+
+def test_unit_registry_is_still_available_on_demand():
+    from opensolids.units import UREG, unit_registry
+
+    assert UREG is unit_registry()
+    assert (1 * UREG("MPa")).to("Pa").magnitude == pytest.approx(1.0e6)
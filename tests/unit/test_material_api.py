@@ -1,6 +1,8 @@
 import numpy as np
+import pytest
 
 import opensolids as osl
+from opensolids.registry import default_registry
 
 
 def test_material_lookup_and_property_calls():
@@ -64,3 +66,116 @@ def test_list_providers_and_search():
     provider_results = osl.search("cucrzr", include_provider_records=True)
     provider_ids = {r.id for r in provider_results}
     assert "ntrs:20210010991:cucrzr" in provider_ids
+
+
+def test_scalar_fast_path_matches_array_evaluation():
+    reg = default_registry()
+    for material_id in reg.list_canonical_material_ids() + sorted(reg.material_index()):
+        mat = reg.material(material_id)
+        for key in mat._properties:
+            curve = mat.curve(key)
+            lo, hi = curve.valid_T_min, curve.valid_T_max
+            temperatures = [lo, (lo + hi) / 2.0, hi, hi + 25.0, (3 * lo + hi) / 4.0]
+            for policy in ("clamp", "extrapolate"):
+                expected = curve(np.array(temperatures), policy=policy)
+                got = [curve(t, policy=policy) for t in temperatures]
+                assert all(isinstance(value, float) for value in got)
+                np.testing.assert_allclose(got, expected, rtol=1e-12, err_msg=material_id)
+
+    mat = osl.material("al-6061-t6")
+    assert mat.diffusivity(300.0) == mat.diffusivity(np.array([300.0]))[0]
+    with pytest.raises(ValueError):
+        mat.k(1.0e5, policy="raise")
+    with pytest.raises(ValueError):
+        mat.k(300.0, policy="nearest")
+
+
+def test_bound_property_matches_material_accessors():
+    mat = osl.material("in718-am")
+
+    k = mat.bind("k")
+    assert k(300.0) == mat.k(300.0)
+    np.testing.assert_allclose(k(np.array([100.0, 300.0])), mat.k([100.0, 300.0]))
+
+    sigma_y = mat.bind("sigma_y", units="MPa", policy="extrapolate")
+    assert (sigma_y.scale, sigma_y.offset) == pytest.approx((1e-6, 0.0))
+    expected = mat.sigma_y(293.15, units="MPa", policy="extrapolate")
+    assert sigma_y(293.15) == pytest.approx(expected, rel=1e-12)
+    np.testing.assert_allclose(
+        sigma_y(np.array([293.15, 500.0])),
+        mat.sigma_y([293.15, 500.0], units="MPa", policy="extrapolate"),
+        rtol=1e-12,
+    )
+
+    strict = mat.bind("k", policy="raise")
+    with pytest.raises(ValueError, match="out of range"):
+        strict(1.0e5)
+    with pytest.raises(ValueError):
+        mat.bind("k", policy="nearest")
+    with pytest.raises(KeyError):
+        mat.bind("unobtainium")
+
+
+def test_bind_supports_derived_diffusivity():
+    mat = osl.material("al-6061-t6")
+    assert "diffusivity" in mat.available_properties()
+    assert "diffusivity" not in mat._properties
+
+    diffusivity = mat.bind("diffusivity")
+    assert diffusivity(293.15) == pytest.approx(mat.diffusivity(293.15), rel=1e-12)
+    T = np.array([100.0, 293.15, 500.0])
+    np.testing.assert_allclose(diffusivity(T), mat.diffusivity(T), rtol=1e-12)
+
+    mm2 = mat.bind("diffusivity", units="mm^2/s", policy="extrapolate")
+    expected = mat.diffusivity(T, units="mm^2/s", policy="extrapolate")
+    np.testing.assert_allclose(mm2(T), expected, rtol=1e-12)
+
+
+def test_convert_values_uses_compiled_affine_transform():
+    from opensolids.units import UREG, _compile_conversion, convert_values
+
+    T = np.linspace(20.0, 900.0, 17)
+    stress = np.linspace(1.0e8, 1.2e9, 17)
+    np.testing.assert_allclose(
+        convert_values(stress, "Pa", "MPa"), (stress * UREG.Pa).to("MPa").magnitude, rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        convert_values(T, "K", "degC"), UREG.Quantity(T, "K").to("degC").magnitude, rtol=1e-12
+    )
+    assert isinstance(convert_values(300.0, "K", "degC"), float)
+
+    hits = _compile_conversion.cache_info().hits
+    convert_values(stress, "Pa", "MPa")
+    assert _compile_conversion.cache_info().hits == hits + 1
+
+    with pytest.raises(Exception):
+        convert_values(stress, "Pa", "not_a_unit")
+    with pytest.raises(Exception):
+        convert_values(stress, "Pa", "K")
+
+
+def test_eps_th_from_alpha_matches_direct_integration():
+    mat = osl.material("alsi10mg-am")
+    alpha = mat.curve("alpha")
+    T = np.array([250.0, 293.15, 400.0, 650.0, 900.0])
+    trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+    def integrate(t, policy):
+        grid = np.linspace(293.15, t, 20001)
+        return trapezoid(alpha(grid, policy=policy), grid)
+
+    for policy in ("clamp", "extrapolate"):
+        expected = [integrate(t, policy) for t in T]
+        np.testing.assert_allclose(mat.eps_th(T, policy=policy), expected, rtol=1e-7, atol=1e-15)
+
+    # Clamped alpha is constant past the edge, so the strain continues linearly.
+    edge = alpha.valid_T_max
+    assert mat.eps_th(edge + 100.0) - mat.eps_th(edge) == pytest.approx(100.0 * alpha(edge))
+    assert mat.eps_th(400.0) == pytest.approx(mat.eps_th(np.array([400.0]))[0])
+    assert ("alpha", 293.15, None) in mat._reference_cache
+
+    np.testing.assert_allclose(
+        mat.eps_th(np.array([300.0, 400.0]), policy="raise"), mat.eps_th(np.array([300.0, 400.0]))
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        mat.eps_th(np.array([300.0, 1000.0]), policy="raise")
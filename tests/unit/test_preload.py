@@ -0,0 +1,108 @@
+import gc
+import os
+from pathlib import Path
+
+import pytest
+
+from opensolids.preload import measure_fork_sharing, preload
+from opensolids.providers import CuratedPublicProvider, NISTCryoProvider
+from opensolids.registry import ProviderRegistry
+
+
+def _registry() -> ProviderRegistry:
+    reg = ProviderRegistry(material_cache_size=4)
+    reg.register(CuratedPublicProvider())
+    reg.register(NISTCryoProvider())
+    return reg
+
+
+def test_preload_materializes_every_material_curve_and_interns_records():
+    reg = _registry()
+    report = preload(reg, freeze=False)
+
+    provider_ids = reg.providers["nist-cryo"].list_material_ids()
+    assert report.materials == len(reg.canonical_specs) + len(provider_ids) + len(
+        reg.providers["curated-public"].list_material_ids()
+    )
+    assert reg.cache_info().currsize == report.materials
+    assert report.curves > report.materials
+    assert report.interned_strings > 0
+
+    mat = reg.material(provider_ids[0])
+    assert set(mat._curve_cache) == set(mat._properties)
+
+    records = reg.providers["nist-cryo"]._materials.values()
+    units = [curve["units"] for rec in records for curve in rec["properties"].values()]
+    first = {}
+    assert all(first.setdefault(unit, unit) is unit for unit in units)
+
+
+def test_preload_does_not_modify_records_callers_hold():
+    reg = _registry()
+    provider = reg.providers["nist-cryo"]
+    material_id = provider.list_material_ids()[0]
+    held = provider.get_material_record(material_id)
+    name, properties = held["name"], held["properties"]
+
+    preload(reg, freeze=False)
+
+    assert held["name"] is name
+    assert held["properties"] is properties
+    assert provider.get_material_record(material_id) is not held
+    assert provider.get_material_record(material_id) == held
+
+
+def test_preload_can_leave_the_cache_bound_alone():
+    reg = _registry()
+    preload(reg, freeze=False, keep_resident=False)
+    assert reg.material_cache_size == 4
+    assert reg.cache_info().currsize == 4
+
+
+def test_preload_freezes_the_heap():
+    try:
+        preload(_registry())
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not Path("/proc/self/smaps_rollup").exists(),
+    reason="requires fork and /proc/self/smaps_rollup",
+)
+def test_measure_fork_sharing_reports_worker_memory():
+    report = measure_fork_sharing(1, factory=_registry)
+    assert gc.get_freeze_count() == 0
+
+    assert [w.mode for w in report.preloaded] == ["preloaded"]
+    assert [w.mode for w in report.cold] == ["cold"]
+    assert all(w.rss_kb >= w.uss_kb > 0 for w in report.preloaded + report.cold)
+    # Page accounting varies by kernel and allocator; sharing must at least not cost memory.
+    assert report.uss_saved_kb >= 0
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "fork") or not Path("/proc/self/smaps_rollup").exists(),
+    reason="requires fork and /proc/self/smaps_rollup",
+)
+def test_measure_fork_sharing_reaps_every_child_when_workers_fail(monkeypatch):
+    from opensolids import preload as preload_module
+
+    forked = []
+    fork_worker = preload_module._fork_worker
+
+    def failing_fork_worker(mode, work):
+        pid, read_fd = fork_worker(mode, lambda: os._exit(3))
+        forked.append(pid)
+        return pid, read_fd
+
+    monkeypatch.setattr(preload_module, "_fork_worker", failing_fork_worker)
+    with pytest.raises(RuntimeError, match="workers failed"):
+        measure_fork_sharing(2, factory=_registry)
+
+    assert len(forked) == 4
+    assert gc.get_freeze_count() == 0
+    for pid in forked:
+        with pytest.raises(ChildProcessError):
+            os.waitpid(pid, os.WNOHANG)
@@ -0,0 +1,118 @@
+import pytest
+
+from opensolids.providers import (
+    CuratedPublicProvider,
+    MilHdbk5Provider,
+    NISTCryoProvider,
+    NTRSOpenAPIProvider,
+)
+from opensolids.registry import ProviderRegistry
+
+
+def _registry(**kwargs) -> ProviderRegistry:
+    reg = ProviderRegistry(**kwargs)
+    reg.register(CuratedPublicProvider())
+    reg.register(NISTCryoProvider())
+    reg.register(NTRSOpenAPIProvider())
+    reg.register(MilHdbk5Provider())
+    return reg
+
+
+def test_material_cache_reuses_instances_and_counts_hits():
+    reg = _registry()
+
+    first = reg.material("al-6061-t6")
+    second = reg.material("al-6061-t6")
+    assert first is second
+
+    first.k(300.0)
+    assert "k" in second._curve_cache
+
+    info = reg.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+
+def test_material_cache_is_bounded_lru():
+    reg = _registry(material_cache_size=2)
+
+    a = reg.material("c101")
+    reg.material("c110")
+    reg.material("c101")
+    reg.material("ss304")
+
+    assert reg.cache_info().currsize == 2
+    assert reg.material("c101") is a
+    assert reg.cache_info().misses == 3
+
+
+def test_register_invalidates_material_cache():
+    reg = _registry()
+    before = reg.material("cucrzr-am")
+    generation = reg.generation
+
+    reg.register(NTRSOpenAPIProvider())
+
+    assert reg.generation == generation + 1
+    assert reg.cache_info().currsize == 0
+    assert reg.material("cucrzr-am") is not before
+
+
+def test_material_cache_can_be_disabled():
+    reg = _registry(material_cache_size=0)
+    assert reg.material("ss316") is not reg.material("ss316")
+    assert reg.cache_info().currsize == 0
+
+
+def test_search_uses_summary_index_without_building_materials():
+    reg = _registry()
+    reg.search("")
+    reg.clear_cache()
+
+    hits = reg.search("grcop")
+    assert {"grcop-84-am", "grcop-42-am"}.issubset({h.id for h in hits})
+    assert reg.cache_info().misses == 0
+
+    canonical = {h.id: h for h in reg.search("c101")}["c101"]
+    assert canonical.source_count > 0
+    assert "diffusivity" in canonical.property_coverage
+
+
+def test_register_rebuilds_only_affected_summaries():
+    reg = _registry()
+    reg.search("", include_provider_records=True)
+    nist_summaries = reg._provider_summaries["nist-cryo"]
+
+    reg.register(NTRSOpenAPIProvider())
+    assert "ntrs" not in reg._provider_summaries
+    assert reg._provider_summaries["nist-cryo"] is nist_summaries
+
+    ids = {h.id for h in reg.search("cucrzr", include_provider_records=True)}
+    assert {"cucrzr-am", "ntrs:20210010991:cucrzr"}.issubset(ids)
+
+
+def test_material_index_resolves_without_loading_packs():
+    reg = _registry()
+
+    with pytest.raises(KeyError):
+        reg.material("not-a-material")
+    assert not any(provider._loaded for provider in reg.providers.values())
+
+    reg.material("nist-cryo:aluminum-6061-t6")
+    assert set(reg.providers["nist-cryo"]._materials) == {"nist-cryo:aluminum-6061-t6"}
+    assert not reg.providers["mil-hdbk-5"]._materials
+    assert reg.material_index()["mil-hdbk-5:H:inconel-718"] == "mil-hdbk-5"
+
+
+def test_warm_up_loads_every_provider_and_reports_timings():
+    reg = _registry()
+
+    report = reg.warm_up(build_curves=True)
+
+    by_name = {timing.name: timing for timing in report}
+    assert set(by_name) == set(reg.providers) | {"canonical"}
+    assert all(timing.error is None and timing.seconds >= 0 for timing in report)
+    assert all(provider._loaded for provider in reg.providers.values())
+    assert by_name["nist-cryo"].materials == len(reg.providers["nist-cryo"].list_material_ids())
+    assert "k" in reg.material("al-6061-t6")._curve_cache
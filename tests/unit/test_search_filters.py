@@ -16,3 +16,37 @@ def test_search_with_empty_required_properties_matches_default():
     base = osl.search("6061")
     filtered = osl.search("6061", required_properties=[])
     assert [h.id for h in filtered] == [h.id for h in base]
+
+
+def test_required_properties_filter_applies_to_provider_records():
+    hits = osl.search("copper", required_properties=["alpha"], include_provider_records=True)
+    ids = {h.id for h in hits}
+
+    assert "nist-cryo:oxygen-free-copper" in ids
+    assert "nist-cryo:oxygen-free-copper-rrr50" not in ids
+    for hit in hits:
+        assert "alpha" in hit.property_coverage
+
+
+def test_required_properties_matches_material_available_properties():
+    hits = osl.search("", required_properties=["diffusivity"], include_provider_records=True)
+    for hit in hits:
+        assert "diffusivity" in osl.material(hit.id).available_properties()
+
+
+def test_unknown_required_property_matches_nothing():
+    assert osl.search("", required_properties=["not-a-property"]) == []
+
+
+def test_fuzzy_search_ranks_typo_and_separator_variants():
+    assert osl.search("inconel 718 am", fuzzy=True)[0].id == "in718-am"
+    assert osl.search("inconle 718", fuzzy=True)[0].id == "in718-am"
+    assert osl.search("gr-cop42", fuzzy=True)[0].id == "grcop-42-am"
+
+
+def test_fuzzy_search_respects_limit_and_required_properties():
+    hits = osl.search("copper", fuzzy=True, limit=2, include_provider_records=True)
+    assert len(hits) <= 2
+
+    hits = osl.search("grcop", fuzzy=True, required_properties=["cp"])
+    assert hits == []
@@ -0,0 +1,128 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from opensolids.providers import CuratedPublicProvider, NISTCryoProvider
+from opensolids.registry import ProviderRegistry
+from opensolids.shared_catalog import SharedCatalog
+
+
+def _registry() -> ProviderRegistry:
+    reg = ProviderRegistry()
+    reg.register(CuratedPublicProvider())
+    reg.register(NISTCryoProvider())
+    return reg
+
+
+def _evaluate(handle, material_id, T):
+    mat = handle.attach().material(material_id)
+    return mat.k(T).tolist(), [ref.source_id for ref in mat.sources]
+
+
+def test_attached_catalog_matches_registry_without_copying_arrays():
+    reg = _registry()
+    with SharedCatalog.from_registry(reg) as catalog:
+        attached = catalog.handle.attach()
+
+        assert "al-6061-t6" in attached.list_material_ids()
+        for material_id in ("al-6061-t6", "nist-cryo:inconel-718"):
+            shared = attached.material(material_id)
+            expected = reg.material(material_id)
+            np.testing.assert_allclose(shared.k([40.0, 150.0]), expected.k([40.0, 150.0]))
+            assert [s.source_id for s in shared.sources] == [s.source_id for s in expected.sources]
+
+        model = attached.material("nist-cryo:inconel-718").curve("k").model
+        assert not model.coefficients.flags.owndata
+        assert not model.coefficients.flags.writeable
+        assert attached.material("AL 6061 T6") is not None
+        with pytest.raises(KeyError):
+            attached.material("unobtainium")
+        del shared, model
+
+
+def test_process_pool_workers_evaluate_against_shared_block():
+    reg = _registry()
+    T = [60.0, 120.0, 250.0]
+    with SharedCatalog.from_registry(reg, ["ss304", "nist-cryo:inconel-718"]) as catalog:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(2, mp_context=context) as pool:
+            futures = [
+                pool.submit(_evaluate, catalog.handle, material_id, T)
+                for material_id in ("ss304", "nist-cryo:inconel-718") * 2
+            ]
+            results = [future.result() for future in futures]
+
+    material_ids = ("ss304", "nist-cryo:inconel-718") * 2
+    for (values, sources), material_id in zip(results, material_ids):
+        expected = reg.material(material_id)
+        np.testing.assert_allclose(values, expected.k(T))
+        assert sources == [s.source_id for s in expected.sources]
+
+
+_INDEPENDENT_ATTACH = """
+import sys
+from opensolids.shared_catalog import SharedCatalogHandle
+
+catalog = SharedCatalogHandle(sys.argv[1], int(sys.argv[2])).attach()
+print(catalog.material("ss304").k(120.0))
+"""
+
+
+def test_independent_process_attach_does_not_unlink_the_block():
+    import os
+    import subprocess
+    import sys
+    from pathlib import Path
+
+    import opensolids
+
+    src_dir = Path(opensolids.__file__).resolve().parents[1]
+    pythonpath = os.pathsep.join([str(src_dir), os.environ.get("PYTHONPATH", "")])
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    reg = _registry()
+    expected = reg.material("ss304").k(120.0)
+
+    with SharedCatalog.from_registry(reg, ["ss304"]) as catalog:
+        args = [sys.executable, "-c", _INDEPENDENT_ATTACH, catalog.handle.name]
+        for _ in range(2):
+            out = subprocess.run(
+                [*args, str(catalog.handle.size)],
+                capture_output=True,
+                check=True,
+                env=env,
+                text=True,
+            )
+            assert float(out.stdout) == pytest.approx(expected)
+            assert "leaked" not in out.stderr
+        assert catalog.handle.attach().material("ss304").k(120.0) == pytest.approx(expected)
+
+
+def test_concurrent_attach_builds_one_catalog(monkeypatch):
+    import threading
+
+    from opensolids import shared_catalog
+
+    built = []
+    init = shared_catalog.AttachedCatalog.__init__
+
+    def slow_init(self, handle):
+        built.append(self)
+        threading.Event().wait(0.01)
+        init(self, handle)
+
+    monkeypatch.setattr(shared_catalog.AttachedCatalog, "__init__", slow_init)
+    with SharedCatalog.from_registry(_registry(), ["ss304"]) as catalog:
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(catalog.handle.attach()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(attached is results[0] for attached in results)
@@ -0,0 +1,43 @@
+from opensolids.search import FuzzyIndex, TextIndex, matches_query
+
+
+RECORDS = [
+    ("Stainless Steel 304", "nist-cryo:stainless-steel-304", None, "304 Stainless", "UNS S30400"),
+    ("Aluminum 6061-T6", "nist-cryo:aluminum-6061-t6", "T6", "al6061-t6"),
+    ("GRCop-84", "ntrs:20070017311:grcop-84", "HIP", "gr-cop-84"),
+    ("Copper C110", "curated-public:c110-room-temp", "annealed", "ETP  Copper"),
+]
+
+QUERIES = ["", "3", "30", "304", "steel 304", "STAINLESS", "6061-t6", "cop", "c110", "etp copper", "xyz", "  t6 "]
+
+
+def test_text_index_matches_linear_scan_semantics():
+    index = TextIndex()
+    for fields in RECORDS:
+        index.add(*fields)
+
+    for query in QUERIES:
+        expected = [i for i, fields in enumerate(RECORDS) if matches_query(query, *fields)]
+        assert index.search(query) == expected, query
+
+
+def test_text_index_scales_to_large_catalogs():
+    index = TextIndex()
+    for i in range(20000):
+        index.add(f"Imported Alloy {i:05d}", f"bulk:alloy-{i:05d}", "annealed")
+
+    assert index.search("alloy 01234") == [1234]
+    assert len(index.search("bulk:alloy-0001")) == 10
+    assert index.search("missing") == []
+
+
+def test_fuzzy_index_scores_only_sharing_candidates():
+    index = FuzzyIndex()
+    index.add("grcop-42-am", "GRCop-42 (AM)", "gr-cop-42")
+    index.add("grcop-84-am", "GRCop-84 (AM)", "gr-cop-84")
+    index.add("in718-am", "IN718 (AM)", "inconel 718")
+
+    hits = index.search("gr cop 42", limit=3)
+    assert [doc for doc, _ in hits][:2] == [0, 1]
+    assert hits[0][1] == 1.0
+    assert index.search("zzzz") == []
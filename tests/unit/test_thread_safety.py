@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from opensolids import registry as registry_module
+from opensolids.providers import NISTCryoProvider
+from opensolids.registry import ProviderRegistry, default_registry
+
+THREADS = 16
+
+
+def _run_concurrently(fn, n: int = THREADS) -> list:
+    barrier = threading.Barrier(n)
+
+    def task(i):
+        barrier.wait()
+        return fn(i)
+
+    with ThreadPoolExecutor(n) as pool:
+        return list(pool.map(task, range(n)))
+
+
+def test_provider_reads_each_record_once_under_concurrency(monkeypatch):
+    provider = NISTCryoProvider()
+    reads: list[str] = []
+    original = provider._read_material_file
+
+    def counting_read(name):
+        reads.append(name)
+        return original(name)
+
+    monkeypatch.setattr(provider, "_read_material_file", counting_read)
+    ids = provider.list_material_ids()
+
+    records = _run_concurrently(lambda i: provider.get_material_record(ids[i % len(ids)]))
+
+    assert len(reads) == len(ids)
+    for i, record in enumerate(records):
+        assert record is provider.get_material_record(ids[i % len(ids)])
+
+
+def test_concurrent_full_load_runs_once(monkeypatch):
+    provider = NISTCryoProvider()
+    loads = []
+    original = provider._read_json_pack
+
+    def counting_load():
+        loads.append(1)
+        return original()
+
+    monkeypatch.setattr(provider, "_read_json_pack", counting_load)
+
+    _run_concurrently(lambda i: provider.preload() if i % 2 else provider.source_lookup())
+
+    assert len(loads) == 1
+    assert len(provider._materials) == len(provider.list_material_ids())
+
+
+def test_default_registry_is_built_once(monkeypatch):
+    monkeypatch.setattr(registry_module, "_DEFAULT_REGISTRY", None)
+
+    registries = _run_concurrently(lambda i: default_registry())
+
+    assert all(reg is registries[0] for reg in registries)
+
+
+def test_concurrent_material_lookups_share_instances_and_curves():
+    reg = ProviderRegistry()
+    reg.register(NISTCryoProvider())
+    names = ["ss304", "inconel-718", "ss316", "al-6061-t6"]
+
+    def lookup(i):
+        mat = reg.material(names[i % len(names)])
+        return mat, mat.curve("k")
+
+    results = _run_concurrently(lookup, 32)
+
+    for i, (mat, curve) in enumerate(results):
+        assert mat is reg.material(names[i % len(names)])
+        assert curve is mat.curve("k")
+    assert reg.cache_info().currsize == len(names)
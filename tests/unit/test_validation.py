@@ -1,7 +1,10 @@
 import json
 from pathlib import Path
 
-from opensolids.validation import validate_material_record
+import pytest
+
+from opensolids import validation
+from opensolids.validation import ValidationCache, validate_material_record
 
 
 
@@ -16,3 +19,55 @@ def test_sample_data_records_validate():
     for base in base_dirs:
         for fp in base.glob("*.json"):
             validate_material_record(json.loads(fp.read_text()))
+
+
+def _count_validations(monkeypatch):
+    calls = []
+    original = validation.validate_material_record
+
+    def counting(record):
+        calls.append(record["id"])
+        original(record)
+
+    monkeypatch.setattr(validation, "validate_material_record", counting)
+    return calls
+
+
+def test_validation_cache_skips_unchanged_files(tmp_path, monkeypatch):
+    calls = _count_validations(monkeypatch)
+    fp = Path("packages/opensolids_data_nist_cryo/src/opensolids_data_nist_cryo/materials/nist_304.json")
+    payload = fp.read_bytes()
+    record = json.loads(payload)
+
+    cache = ValidationCache(tmp_path, strict=False)
+    cache.validate(payload, record)
+    cache.validate(payload, record)
+    assert len(calls) == 1
+
+    edited = payload.replace(b"Stainless Steel 304", b"Stainless Steel 304 edited")
+    cache.validate(edited, json.loads(edited))
+    assert len(calls) == 2
+
+    strict = ValidationCache(tmp_path, strict=True)
+    strict.validate(payload, record)
+    assert len(calls) == 3
+
+
+def test_validation_cache_does_not_remember_invalid_records(tmp_path):
+    cache = ValidationCache(tmp_path, strict=False)
+    payload = b'{"id": "bad", "name": "Bad"}'
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.validate(payload, json.loads(payload))
+
+
+def test_validation_cache_is_keyed_on_validator_rules(tmp_path, monkeypatch):
+    from opensolids import validation
+
+    cache = ValidationCache(tmp_path)
+    assert cache.directory.name.endswith(validation.validator_fingerprint())
+    assert validation.default_cache_dir() != Path.home() / ".cache" / "opensolids"
+
+    monkeypatch.setitem(validation.CANONICAL_UNITS, "k", "W/(m*degK)")
+    assert ValidationCache(tmp_path).directory != cache.directory